@@ -0,0 +1,111 @@
+"""
+Timing benchmarks for the SIR vaccination model.
+
+Run from src/:  python benchmarks.py
+"""
+import time
+import numpy as np
+from scipy.integrate import solve_ivp
+
+import sir_vaccination as sv
+
+def _timed(func, *args, **kwargs):
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+def solve_each(betas, gammas, rates):
+    """The original approach: one solve_ivp call per scenario."""
+    out = []
+    for b, g, v in zip(betas, gammas, rates):
+        y0 = [sv.N - v * sv.N - sv.I_initial, sv.I_initial, 0.0]
+        sol = solve_ivp(lambda t, y: sv.sir_with_vaccination(t, y, b, g, sv.N),
+                        (sv.t_start, sv.t_end), y0, t_eval=sv.t_eval)
+        out.append(sol.y)
+    return sv.t_eval, np.array(out).transpose(1, 0, 2)
+
+def bench_sweep(n_beta=10, n_gamma=10, n_rates=10):
+    """
+    Scenario sweep: a solve_ivp call per scenario vs the stacked system
+    (fixed-grid RK4, the default, and adaptive RK45 at the default and at
+    sqrt(n_scenarios)-scaled tolerances). Errors are the max deviation
+    from a DOP853 rtol=1e-10 solution, as a fraction of N; the default
+    stacked sweep must be at least as accurate as per-scenario solves.
+    """
+    betas, gammas, rates = sv.scenario_grid(np.linspace(0.2, 0.4, n_beta),
+                                            np.linspace(1 / 14, 1 / 5, n_gamma),
+                                            np.linspace(0.0, 0.7, n_rates))
+    _, reference = sv.sweep_scenarios(betas, gammas, rates, method="DOP853", rtol=1e-10, atol=1e-6)
+
+    print(f"SIR vaccination sweep, {betas.size} scenarios")
+    scale = np.sqrt(betas.size)
+    runs = {
+        "solve_ivp per scenario": lambda: solve_each(betas, gammas, rates),
+        "stacked, RK4 fixed grid": lambda: sv.sweep_scenarios(betas, gammas, rates),
+        "stacked, RK45": lambda: sv.sweep_scenarios(betas, gammas, rates, method="RK45"),
+        "stacked, RK45 scaled tol": lambda: sv.sweep_scenarios(betas, gammas, rates, method="RK45",
+                                                               rtol=1e-3 / scale, atol=1e-6 / scale),
+    }
+    errors = {}
+    for name, run in runs.items():
+        (_, states), elapsed = _timed(run)
+        errors[name] = np.abs(states - reference).max() / sv.N
+        print(f"  {name:<24} {elapsed:8.3f} s   max error {errors[name]:.1e} N")
+    assert errors["stacked, RK4 fixed grid"] <= errors["solve_ivp per scenario"]
+
+def _solve_stats(fun, y0, t_end, method, jac=None, **options):
+    """solve_ivp RHS and Jacobian evaluation counts and wall time [ms]."""
+    if jac is not None:
+        options["jac"] = jac
+    start = time.perf_counter()
+    sol = solve_ivp(fun, (0, t_end), y0, method=method, **options)
+    return sol.nfev, sol.njev, 1e3 * (time.perf_counter() - start)
+
+def bench_jacobian(t_end=(160, 5000), n_scenarios=200):
+    """
+    Default RK45 vs BDF, Radau and LSODA with the analytic Jacobian, and
+    BDF with solve_ivp's finite-difference Jacobian; one scenario and a
+    stacked sweep (sparse Jacobian).
+    """
+    rng = np.random.default_rng(0)
+    betas = rng.uniform(0.2, 0.4, n_scenarios)
+    gammas = rng.uniform(1 / 14, 1 / 5, n_scenarios)
+    rates = rng.uniform(0.0, 0.7, n_scenarios)
+    y0_one = [sv.N - sv.I_initial, sv.I_initial, 0.0]
+    y0_many = np.concatenate([sv.N - rates * sv.N - sv.I_initial,
+                              np.full(n_scenarios, sv.I_initial), np.zeros(n_scenarios)])
+
+    def one(t, y):
+        return sv.sir_with_vaccination(t, y, sv.beta, sv.gamma, sv.N)
+
+    def one_jac(t, y):
+        return sv.sir_jacobian(t, y, sv.beta, sv.gamma, sv.N)
+
+    def many(t, y):
+        return sv.sir_vaccination_batch(t, y, betas, gammas, sv.N)
+
+    def many_jac(t, y):
+        return sv.sir_vaccination_batch_jacobian(t, y, betas, gammas, sv.N)
+
+    def many_dense(t, y):
+        return many_jac(t, y).toarray()
+
+    cases = [
+        ("RK45 (default)", "RK45", None, None),
+        ("BDF, analytic", "BDF", one_jac, many_jac),
+        ("Radau, analytic", "Radau", one_jac, many_jac),
+        ("LSODA, analytic", "LSODA", one_jac, many_dense),
+        ("BDF, finite diff.", "BDF", None, None),
+    ]
+    for horizon in t_end:
+        print(f"SIR solvers, t_end = {horizon} days")
+        print(f"  {'':<18} {'1 scenario: nfev':>16} {'njev':>5} {'[ms]':>7}   "
+              f"{f'{n_scenarios} stacked: nfev':>20} {'njev':>5} {'[ms]':>8}")
+        for name, method, jac_one, jac_many in cases:
+            nfev, njev, ms = _solve_stats(one, y0_one, horizon, method, jac_one)
+            nfev_b, njev_b, ms_b = _solve_stats(many, y0_many, horizon, method, jac_many, vectorized=True)
+            print(f"  {name:<18} {nfev:>16} {njev:>5} {ms:>7.1f}   {nfev_b:>20} {njev_b:>5} {ms_b:>8.1f}")
+
+if __name__ == "__main__":
+    bench_sweep()
+    bench_jacobian()
@@ -1,12 +1,9 @@
 import numpy as np
 import matplotlib.pyplot as plt
+from scipy import sparse
 from scipy.integrate import solve_ivp
 import os
 
-# Ensure folders exist
-os.makedirs("../results", exist_ok=True)
-os.makedirs("../data", exist_ok=True)
-
 # Total population
 N = 1_000_000
 
@@ -21,6 +18,9 @@ vaccination_rates = [0.0, 0.2, 0.5, 0.7]
 t_start, t_end = 0, 160
 t_eval = np.linspace(t_start, t_end, 400)
 
+# Infected individuals at t=0 in every scenario
+I_initial = 100.0
+
 def sir_with_vaccination(t, y, beta, gamma, N):
     S, I, R = y
     dSdt = -beta * S * I / N
@@ -28,68 +28,173 @@ def sir_with_vaccination(t, y, beta, gamma, N):
     dRdt = gamma * I
     return [dSdt, dIdt, dRdt]
 
-results = {}
-
-for v in vaccination_rates:
-    # Initial conditions
-    V = v * N
-    I0 = 100.0
-    R0 = 0.0
-    S0 = N - V - I0 - R0
-
-    y0 = [S0, I0, R0]
-
-    sol = solve_ivp(
-        fun=lambda t, y: sir_with_vaccination(t, y, beta, gamma, N),
-        t_span=(t_start, t_end),
-        y0=y0,
-        t_eval=t_eval
-    )
-
-    results[v] = {
-        "t": sol.t,
-        "S": sol.y[0],
-        "I": sol.y[1],
-        "R": sol.y[2]
-    }
+def sir_jacobian(t, y, beta, gamma, N):
+    """Analytic Jacobian of sir_with_vaccination."""
+    S, I, R = y
+    return np.array([
+        [-beta * I / N, -beta * S / N, 0.0],
+        [beta * I / N, beta * S / N - gamma, 0.0],
+        [0.0, gamma, 0.0],
+    ])
+
+# solve_ivp methods that use a Jacobian; LSODA only takes dense ones
+STIFF_METHODS = ("BDF", "Radau", "LSODA")
+
+def solve_scenario(beta, gamma, rate, N=N, t_eval=t_eval, method="RK45", **solver_options):
+    """
+    Solve one vaccination scenario with solve_ivp, passing sir_jacobian
+    to the implicit methods in STIFF_METHODS.
+    """
+    y0 = [N - rate * N - I_initial, I_initial, 0.0]
+    if method in STIFF_METHODS:
+        solver_options["jac"] = lambda t, y: sir_jacobian(t, y, beta, gamma, N)
+    return solve_ivp(lambda t, y: sir_with_vaccination(t, y, beta, gamma, N),
+                     (t_eval[0], t_eval[-1]), y0, method=method, t_eval=t_eval, **solver_options)
+
+# Scenario sweep: all scenarios stacked into one ODE system
+
+def scenario_grid(betas, gammas, rates):
+    """All (beta, gamma, vaccination) combinations as three flat arrays."""
+    grid = np.meshgrid(betas, gammas, rates, indexing="ij")
+    return tuple(g.ravel() for g in grid)
+
+def sir_vaccination_batch(t, y, beta, gamma, N):
+    """
+    sir_with_vaccination for n_scenarios stacked states. y is the
+    flattened (3, n_scenarios) state, or (3 * n_scenarios, k) when
+    solve_ivp evaluates k states at once (vectorized=True); beta and
+    gamma are per-scenario arrays.
+    """
+    S, I, R = y.reshape(3, beta.size, -1)
+    infection = (beta / N)[:, None] * S * I
+    recovery = gamma[:, None] * I
+    return np.stack([-infection, infection - recovery, recovery]).reshape(y.shape)
+
+def sir_vaccination_batch_jacobian(t, y, beta, gamma, N):
+    """
+    Jacobian of sir_vaccination_batch: each scenario only couples to
+    itself, so every (compartment, compartment) block is diagonal.
+    Sparse (3 n, 3 n) with 5 n entries.
+    """
+    S, I, R = y.reshape(3, beta.size)
+    d = sparse.diags
+    return sparse.bmat([
+        [d(-beta * I / N), d(-beta * S / N), None],
+        [d(beta * I / N), d(beta * S / N - gamma), None],
+        [None, d(gamma), sparse.csr_matrix((beta.size, beta.size))],
+    ], format="csc")
+
+def rk4_fixed(fun, t_grid, y0, substeps=4):
+    """
+    Classic fourth-order Runge-Kutta on a fixed grid: substeps equal steps
+    between consecutive points of t_grid. Returns y at t_grid, shape
+    (len(y0), len(t_grid)).
+    """
+    y = np.array(y0, dtype=float)
+    out = np.empty((y.size, len(t_grid)))
+    out[:, 0] = y
+    for j in range(1, len(t_grid)):
+        h = (t_grid[j] - t_grid[j - 1]) / substeps
+        t = t_grid[j - 1]
+        for _ in range(substeps):
+            k1 = fun(t, y)
+            k2 = fun(t + h / 2, y + h / 2 * k1)
+            k3 = fun(t + h / 2, y + h / 2 * k2)
+            k4 = fun(t + h, y + h * k3)
+            y = y + h / 6 * (k1 + 2 * k2 + 2 * k3 + k4)
+            t += h
+        out[:, j] = y
+    return out
 
-    # Save time series to data
-    data_arr = np.vstack([sol.t, sol.y[0], sol.y[1], sol.y[2]]).T
-    np.savetxt(f"../data/sir_vaccination_v{int(v*100)}.csv",
-               data_arr,
-               delimiter=",",
-               header="t,S,I,R",
-               comments="")
-
-# Plot: infection curves for all vaccination scenarios
-plt.figure(figsize=(8, 6))
-for v in vaccination_rates:
-    plt.plot(results[v]["t"], results[v]["I"], label=f"Vaccination {int(v*100)}%")
-plt.xlabel("Time (days)")
-plt.ylabel("Infected individuals")
-plt.title("SIR Dynamics Under Different Vaccination Rates")
-plt.legend()
-plt.grid(True, alpha=0.3)
-plt.tight_layout()
-plt.savefig("../results/infected_vs_time_vaccination.png", dpi=300)
-plt.close()
-
-# Plot: S, I, R for a selected scenario (e.g., 0% and 50%)
-for v in [0.0, 0.5]:
-    t = results[v]["t"]
-    S = results[v]["S"]
-    I = results[v]["I"]
-    R = results[v]["R"]
+def sweep_scenarios(betas, gammas, rates, N=N, t_eval=t_eval, method="rk4", substeps=4,
+                    **solver_options):
+    """
+    Solve every (beta, gamma, vaccination rate) scenario in one ODE system.
 
+    The arguments broadcast to one value per scenario (see scenario_grid).
+    With method="rk4" (default) the system is integrated on t_eval with a
+    fixed step (substeps per interval), so every scenario gets the same
+    accuracy. Adaptive solvers control an RMS error over all stacked
+    scenarios, so single scenarios can drift beyond rtol/atol; scale the
+    tolerances down by about sqrt(n_scenarios) when using them. Any other
+    method is passed to solve_ivp together with solver_options (rtol,
+    atol, ...), with the sparse analytic Jacobian for the methods in
+    STIFF_METHODS. Returns t and the states, shape (3, n_scenarios, len(t)).
+    """
+    betas, gammas, rates = (np.ravel(a).astype(float) for a in np.broadcast_arrays(betas, gammas, rates))
+    S0 = N - rates * N - I_initial
+    y0 = np.concatenate([S0, np.full(betas.size, I_initial), np.zeros(betas.size)])
+
+    def rhs(t, y):
+        return sir_vaccination_batch(t, y, betas, gammas, N)
+
+    if method == "LSODA":
+        solver_options["jac"] = lambda t, y: sir_vaccination_batch_jacobian(t, y, betas, gammas, N).toarray()
+    elif method in STIFF_METHODS:
+        solver_options["jac"] = lambda t, y: sir_vaccination_batch_jacobian(t, y, betas, gammas, N)
+
+    if method == "rk4":
+        y = rk4_fixed(rhs, t_eval, y0, substeps)
+        t = np.asarray(t_eval)
+    else:
+        sol = solve_ivp(rhs, (t_eval[0], t_eval[-1]), y0, method=method,
+                        t_eval=t_eval, vectorized=True, **solver_options)
+        t, y = sol.t, sol.y
+    return t, y.reshape(3, betas.size, t.size)
+
+def save_sweep(path, t, states, betas, gammas, rates):
+    """
+    Write a sweep to one columnar .npz file: per-scenario parameter
+    columns (beta, gamma, vaccination) and S, I, R of shape
+    (n_scenarios, len(t)).
+    """
+    np.savez(path, t=t, beta=betas, gamma=gammas, vaccination=rates,
+             S=states[0], I=states[1], R=states[2])
+
+if __name__ == "__main__":
+    os.makedirs("../results", exist_ok=True)
+    os.makedirs("../data", exist_ok=True)
+
+    rates = np.array(vaccination_rates)
+    betas = np.full(rates.size, beta)
+    gammas = np.full(rates.size, gamma)
+    t, states = sweep_scenarios(betas, gammas, rates)
+    save_sweep("../data/sir_vaccination_sweep.npz", t, states, betas, gammas, rates)
+
+    results = {
+        v: {"t": t, "S": states[0, i], "I": states[1, i], "R": states[2, i]}
+        for i, v in enumerate(vaccination_rates)
+    }
+
+    # Plot: infection curves for all vaccination scenarios
     plt.figure(figsize=(8, 6))
-    plt.plot(t, S, label="Susceptible")
-    plt.plot(t, I, label="Infected")
-    plt.plot(t, R, label="Recovered")
+    for v in vaccination_rates:
+        plt.plot(results[v]["t"], results[v]["I"], label=f"Vaccination {int(v*100)}%")
     plt.xlabel("Time (days)")
-    plt.ylabel("Number of individuals")
-    plt.title(f"SIR Trajectories (Vaccination {int(v*100)}%)")
+    plt.ylabel("Infected individuals")
+    plt.title("SIR Dynamics Under Different Vaccination Rates")
     plt.legend()
     plt.grid(True, alpha=0.3)
     plt.tight_layout()
-    plt.savefig(f"../results/sir_trajectories_v{int(v*100)}.png", dpi=300)
+    plt.savefig("../results/infected_vs_time_vaccination.png", dpi=300)
     plt.close()
+
+    # Plot: S, I, R for a selected scenario (e.g., 0% and 50%)
+    for v in [0.0, 0.5]:
+        t = results[v]["t"]
+        S = results[v]["S"]
+        I = results[v]["I"]
+        R = results[v]["R"]
+
+        plt.figure(figsize=(8, 6))
+        plt.plot(t, S, label="Susceptible")
+        plt.plot(t, I, label="Infected")
+        plt.plot(t, R, label="Recovered")
+        plt.xlabel("Time (days)")
+        plt.ylabel("Number of individuals")
+        plt.title(f"SIR Trajectories (Vaccination {int(v*100)}%)")
+        plt.legend()
+        plt.grid(True, alpha=0.3)
+        plt.tight_layout()
+        plt.savefig(f"../results/sir_trajectories_v{int(v*100)}.png", dpi=300)
+        plt.close()
@@ -0,0 +1,133 @@
+"""
+Timing benchmarks for the age-structured SEIR model.
+
+Run from src/:  python benchmarks.py
+"""
+import tempfile
+import time
+import numpy as np
+from scipy import sparse
+from scipy.integrate import solve_ivp
+
+import seir_age_structured as seir
+from seir_engine import SEIRModel
+from ensemble import ColumnStore, run_ensemble, T_EVAL
+
+def _best_time(func, *args, repeat=3):
+    best = np.inf
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def bench_jacobian(regimes=None):
+    """
+    Default RK45 vs BDF, Radau and LSODA with the analytic (sparse)
+    Jacobian, and BDF with solve_ivp's finite-difference Jacobian:
+    RHS/Jacobian evaluation counts and wall time.
+    """
+    if regimes is None:
+        regimes = {
+            "script parameters, 200 days": dict(t_span=(0, 200)),
+            "1-hour incubation, 2000 days": dict(t_span=(0, 2000), sigma=24.0),
+        }
+    for label, params in regimes.items():
+        print(f"SEIR solvers, {label}")
+        print(f"  {'':<18} {'nfev':>7} {'njev':>5} {'[ms]':>8}")
+        for name, method, analytic in [("RK45 (default)", "RK45", False),
+                                       ("BDF, analytic", "BDF", True),
+                                       ("Radau, analytic", "Radau", True),
+                                       ("LSODA, analytic", "LSODA", True),
+                                       ("BDF, finite diff.", "BDF", False)]:
+            start = time.perf_counter()
+            if analytic or method == "RK45":
+                sol = seir.solve_seir(method, **params)
+            else:
+                # Bypass solve_seir so solve_ivp estimates the Jacobian
+                sigma = params.get("sigma", seir.sigma)
+                sol = solve_ivp(lambda t, y: seir.seir_age_structured(t, y, sigma=sigma),
+                                params["t_span"], seir.y0, method=method)
+            elapsed = 1e3 * (time.perf_counter() - start)
+            print(f"  {name:<18} {sol.nfev:>7} {sol.njev:>5} {elapsed:>8.1f}")
+
+def metapopulation(n_regions, n_neighbors=4, coupling=0.05, seed=0):
+    """
+    The script's 3 age groups in n_regions regions on a ring: contacts
+    within a region follow C, contacts with each of the n_neighbors
+    nearest regions are scaled by coupling. Returns (C, N), sparse C.
+    """
+    rng = np.random.default_rng(seed)
+    offsets = [k for k in range(-(n_neighbors // 2), n_neighbors // 2 + 1) if k != 0]
+    regions = sparse.identity(n_regions, format="csr")
+    if n_regions > n_neighbors:
+        regions = regions + coupling * sparse.diags([1.0] * len(offsets), offsets,
+                                                    shape=(n_regions, n_regions))
+    C = sparse.kron(regions, seir.C, format="csr")
+    N = np.kron(rng.uniform(0.5, 1.5, n_regions), seir.N / 100)
+    return C, N
+
+def split_concat_rhs(C, N, beta=seir.beta, sigma=seir.sigma, gamma=seir.gamma):
+    """The script's RHS (np.split / np.concatenate) for another C and N."""
+    return lambda t, y: seir.seir_age_structured(t, y, beta, sigma, gamma, C, N)
+
+def bench_scaling(regions=(1, 10, 100, 1000, 3334), n_scenarios=8, t_eval=np.linspace(0, 200, 201)):
+    """
+    Per-call RHS cost of the script's dense split/concatenate RHS vs
+    SEIRModel with a sparse C, and full solves for one scenario and for
+    n_scenarios batched (beta varied), from 3 to ~10,000 groups.
+    """
+    print("SEIR engine scaling")
+    print(f"{'groups':>7} {'nnz(C)':>8} {'script RHS [us]':>16} {'engine RHS [us]':>16} "
+          f"{'solve [s]':>10} {f'{n_scenarios} scenarios [s]':>16}")
+    for n_regions in regions:
+        C, N = metapopulation(n_regions)
+        n_groups = N.size
+        E0 = np.where(np.arange(n_groups) < 3, 50.0, 0.0)
+        I0 = np.where(np.arange(n_groups) < 3, 20.0, 0.0)
+
+        model = SEIRModel(C, N, seir.beta, seir.sigma, seir.gamma)
+        y0 = model.initial_state(E0, I0)
+        out = np.empty_like(y0)
+        t_engine = _best_time(lambda: [model.rhs(0.0, y0, out) for _ in range(100)]) / 100
+        if n_groups <= 3000:
+            script_rhs = split_concat_rhs(C.toarray(), N)
+            assert np.allclose(script_rhs(0.0, y0), model.rhs(0.0, y0), rtol=1e-12, atol=1e-9)
+            t_script = f"{1e6 * _best_time(lambda: [script_rhs(0.0, y0) for _ in range(100)]) / 100:>16.1f}"
+        else:
+            t_script = f"{'-':>16}"
+
+        t_solve = _best_time(model.solve, y0, t_eval, repeat=1)
+        batched = SEIRModel(C, N, np.linspace(0.2, 0.3, n_scenarios), seir.sigma, seir.gamma)
+        t_batch = _best_time(batched.solve, batched.initial_state(E0, I0), t_eval, repeat=1)
+        print(f"{n_groups:>7} {C.nnz:>8} {t_script} {1e6 * t_engine:>16.1f} {t_solve:>10.3f} {t_batch:>16.3f}")
+
+def bench_ensemble(n_samples=400, seed=0, workers=(1, 2, 4)):
+    """
+    Latin hypercube ensemble across a process pool, streamed to a
+    ColumnStore; the stored summaries must be identical for every worker
+    count (after sorting by sample).
+    """
+    print(f"SEIR parameter ensemble, {n_samples} samples")
+    trajectory_bytes = n_samples * seir.y0.size * T_EVAL.size * 8
+    reference = None
+    with tempfile.TemporaryDirectory() as tmp:
+        for n_workers in workers:
+            path = f"{tmp}/ensemble_{n_workers}"
+            start = time.perf_counter()
+            run_ensemble(n_samples, path, seed, n_workers)
+            elapsed = time.perf_counter() - start
+            results = ColumnStore.read(path)
+            order = np.argsort(results["sample"])
+            results = {name: values[order] for name, values in results.items()}
+            if reference is None:
+                reference = results
+            assert all(np.array_equal(results[name], reference[name]) for name in reference)
+            store_bytes = sum(values.nbytes for values in results.values())
+            print(f"  {n_workers} worker(s)  {elapsed:7.2f} s  ({1e3 * elapsed / n_samples:.1f} ms/sample)  "
+                  f"store {store_bytes / 1e3:.0f} kB vs {trajectory_bytes / 1e6:.0f} MB of sol.y")
+
+if __name__ == "__main__":
+    bench_jacobian()
+    bench_scaling()
+    bench_ensemble()
@@ -0,0 +1,116 @@
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+from scipy.stats import qmc
+
+import seir_age_structured as seir
+
+# Sampled parameters and their (low, high) ranges; contact_<group> scales
+# that age group's row of C (its contacts as infectee)
+PARAMETER_RANGES = {
+    "beta": (0.15, 0.35),
+    "sigma": (1 / 7, 1 / 3),
+    "gamma": (1 / 10, 1 / 5),
+    **{f"contact_{group}": (0.5, 1.2) for group in seir.age_groups},
+}
+# Samples per task sent to a worker
+CHUNK_SIZE = 25
+# Daily output grid for the summaries
+T_EVAL = np.arange(0, 201)
+
+def latin_hypercube(n_samples, seed=None, ranges=PARAMETER_RANGES):
+    """n_samples Latin hypercube samples as a dict of columns."""
+    unit = qmc.LatinHypercube(d=len(ranges), seed=seed).random(n_samples)
+    low, high = np.array(list(ranges.values())).T
+    return dict(zip(ranges, qmc.scale(unit, low, high).T))
+
+def summary_columns(age_groups=seir.age_groups):
+    """Column names of the store: sample index, parameters, then summaries."""
+    per_group = [f"{name}_{group}" for name in ("peak_time", "peak_I", "attack_rate")
+                 for group in age_groups]
+    return ["sample", *PARAMETER_RANGES, *per_group, "attack_rate"]
+
+def summarize_sample(beta, sigma, gamma, contact_scaling, t_eval=T_EVAL, y0=seir.y0, C=seir.C, N=seir.N):
+    """
+    Solve the SEIR model for one parameter set and reduce the trajectory:
+    day of the infectious peak and peak I per age group, attack rate
+    (fraction ever infected, 1 - S_end / N) per group and overall.
+    """
+    C = np.asarray(contact_scaling)[:, None] * C
+    sol = seir.solve_seir(t_span=(t_eval[0], t_eval[-1]), t_eval=t_eval, y0=y0,
+                          beta=beta, sigma=sigma, gamma=gamma, C=C, N=N)
+    S, E, I, R = np.split(sol.y, 4)
+    peak = I.argmax(axis=1)
+    return np.concatenate([sol.t[peak], I.max(axis=1), 1 - S[:, -1] / N,
+                           [1 - S[:, -1].sum() / N.sum()]])
+
+def _summarize_chunk(indices, params):
+    n_groups = len(seir.age_groups)
+    rows = []
+    for k in range(len(indices)):
+        p = [params[name][k] for name in PARAMETER_RANGES]
+        rows.append([indices[k], *p, *summarize_sample(p[0], p[1], p[2], p[3:3 + n_groups])])
+    return np.array(rows)
+
+class ColumnStore:
+    """
+    Append-only columnar store: one raw float64 file per column in a
+    directory, plus columns.txt with the column order.
+    """
+
+    def __init__(self, path, columns):
+        self.path = path
+        self.columns = list(columns)
+        os.makedirs(path, exist_ok=True)
+        with open(os.path.join(path, "columns.txt"), "w") as f:
+            f.write("\n".join(self.columns) + "\n")
+        for name in self.columns:
+            open(self._file(path, name), "wb").close()
+
+    @staticmethod
+    def _file(path, name):
+        return os.path.join(path, f"{name}.f64")
+
+    def append(self, rows):
+        """Append rows, an array of shape (n_rows, n_columns)."""
+        rows = np.asarray(rows, dtype="<f8").reshape(-1, len(self.columns))
+        for j, name in enumerate(self.columns):
+            with open(self._file(self.path, name), "ab") as f:
+                rows[:, j].tofile(f)
+
+    @classmethod
+    def read(cls, path, columns=None):
+        """Load columns (all by default) as a dict of arrays."""
+        if columns is None:
+            with open(os.path.join(path, "columns.txt")) as f:
+                columns = f.read().split()
+        return {name: np.fromfile(cls._file(path, name), dtype="<f8") for name in columns}
+
+def run_ensemble(n_samples, path, seed=0, n_workers=4, chunk_size=CHUNK_SIZE):
+    """
+    Parameter-uncertainty ensemble across a process pool.
+
+    Draws n_samples Latin hypercube samples over PARAMETER_RANGES, solves
+    each in chunks of chunk_size and appends the per-sample summaries to a
+    ColumnStore at path as chunks complete, so no trajectories are kept.
+    Rows arrive in completion order; the "sample" column gives the index.
+    Returns the store.
+    """
+    params = latin_hypercube(n_samples, seed)
+    store = ColumnStore(path, summary_columns())
+    with ProcessPoolExecutor(max_workers=n_workers) as pool:
+        futures = []
+        for lo in range(0, n_samples, chunk_size):
+            hi = min(lo + chunk_size, n_samples)
+            chunk = {name: values[lo:hi] for name, values in params.items()}
+            futures.append(pool.submit(_summarize_chunk, np.arange(lo, hi), chunk))
+        for future in as_completed(futures):
+            store.append(future.result())
+    return store
+
+if __name__ == "__main__":
+    run_ensemble(1000, "../data/seir_ensemble", seed=0)
+    results = ColumnStore.read("../data/seir_ensemble")
+    print(f"{results['sample'].size} samples, attack rate "
+          f"{np.percentile(results['attack_rate'], [5, 50, 95]).round(3)} (5/50/95%)")
@@ -1,11 +1,9 @@
 import numpy as np
 import matplotlib.pyplot as plt
+from scipy import sparse
 from scipy.integrate import solve_ivp
 import os
 
-os.makedirs("../results", exist_ok=True)
-os.makedirs("../data", exist_ok=True)
-
 # Age groups: children, adults, seniors
 age_groups = ["0-19", "20-64", "65+"]
 
@@ -33,7 +31,7 @@ S0 = N - E0 - I0 - R0
 
 y0 = np.concatenate([S0, E0, I0, R0])
 
-def seir_age_structured(t, y):
+def seir_age_structured(t, y, beta=beta, sigma=sigma, gamma=gamma, C=C, N=N):
     S, E, I, R = np.split(y, 4)
     lambda_force = beta * (C @ (I / N))
     dS = -lambda_force * S
@@ -42,40 +40,76 @@ def seir_age_structured(t, y):
     dR = gamma * I
     return np.concatenate([dS, dE, dI, dR])
 
+def seir_jacobian(t, y, beta=beta, sigma=sigma, gamma=gamma, C=C, N=N):
+    """
+    Analytic Jacobian of seir_age_structured as a sparse (4n, 4n) matrix.
+
+    With lambda = beta C (I / N), the only dense-in-C blocks are
+    d(dS)/dI = -diag(S) beta C diag(1/N) and its negative d(dE)/dI; the
+    rest is diagonal, so the matrix has the sparsity of C plus 6n entries.
+    """
+    S, E, I, R = np.split(y, 4)
+    n = S.size
+    lambda_force = beta * (C @ (I / N))
+    infection = sparse.diags(S) @ sparse.csr_matrix(beta * C) @ sparse.diags(1.0 / N)
+    eye = sparse.identity(n, format="csr")
+    return sparse.bmat([
+        [sparse.diags(-lambda_force), None, -infection, None],
+        [sparse.diags(lambda_force), -sigma * eye, infection, None],
+        [None, sigma * eye, -gamma * eye, None],
+        [None, None, gamma * eye, sparse.csr_matrix((n, n))],
+    ], format="csc")
+
+# solve_ivp methods that use a Jacobian; LSODA only takes dense ones
+STIFF_METHODS = ("BDF", "Radau", "LSODA")
+
+def solve_seir(method="RK45", t_span=(0, 200), t_eval=None, y0=y0,
+               beta=beta, sigma=sigma, gamma=gamma, C=C, N=N, **solver_options):
+    """
+    Solve the age-structured SEIR model with solve_ivp. For the implicit
+    methods in STIFF_METHODS the analytic Jacobian is supplied.
+    """
+    params = (beta, sigma, gamma, C, N)
+    if method == "LSODA":
+        solver_options["jac"] = lambda t, y: seir_jacobian(t, y, *params).toarray()
+    elif method in STIFF_METHODS:
+        solver_options["jac"] = lambda t, y: seir_jacobian(t, y, *params)
+    return solve_ivp(lambda t, y: seir_age_structured(t, y, *params), t_span, y0,
+                     method=method, t_eval=t_eval, **solver_options)
+
 t_eval = np.linspace(0, 200, 400)
 
-sol = solve_ivp(
-    fun=seir_age_structured,
-    t_span=(0, 200),
-    y0=y0,
-    t_eval=t_eval
-)
-
-S, E, I, R = np.split(sol.y, 4)
-
-# Save data
-np.save("../data/seir_age_structured.npy", sol.y)
-
-# Plot infections by age group
-plt.figure(figsize=(8, 6))
-for idx, group in enumerate(age_groups):
-    plt.plot(sol.t, I[idx], label=f"Infected {group}")
-plt.xlabel("Time (days)")
-plt.ylabel("Infected individuals")
-plt.title("Age-Structured SEIR: Infections Over Time")
-plt.legend()
-plt.grid(alpha=0.3)
-plt.tight_layout()
-plt.savefig("../results/infected_by_age.png", dpi=300)
-plt.close()
-
-# Plot total infections
-plt.figure(figsize=(8, 6))
-plt.plot(sol.t, I.sum(axis=0), color="black", linewidth=2)
-plt.xlabel("Time (days)")
-plt.ylabel("Total infected")
-plt.title("Total Infections Across All Age Groups")
-plt.grid(alpha=0.3)
-plt.tight_layout()
-plt.savefig("../results/total_infected.png", dpi=300)
-plt.close()
+if __name__ == "__main__":
+    os.makedirs("../results", exist_ok=True)
+    os.makedirs("../data", exist_ok=True)
+
+    sol = solve_seir(t_span=(0, 200), t_eval=t_eval)
+
+    S, E, I, R = np.split(sol.y, 4)
+
+    # Save data
+    np.save("../data/seir_age_structured.npy", sol.y)
+
+    # Plot infections by age group
+    plt.figure(figsize=(8, 6))
+    for idx, group in enumerate(age_groups):
+        plt.plot(sol.t, I[idx], label=f"Infected {group}")
+    plt.xlabel("Time (days)")
+    plt.ylabel("Infected individuals")
+    plt.title("Age-Structured SEIR: Infections Over Time")
+    plt.legend()
+    plt.grid(alpha=0.3)
+    plt.tight_layout()
+    plt.savefig("../results/infected_by_age.png", dpi=300)
+    plt.close()
+
+    # Plot total infections
+    plt.figure(figsize=(8, 6))
+    plt.plot(sol.t, I.sum(axis=0), color="black", linewidth=2)
+    plt.xlabel("Time (days)")
+    plt.ylabel("Total infected")
+    plt.title("Total Infections Across All Age Groups")
+    plt.grid(alpha=0.3)
+    plt.tight_layout()
+    plt.savefig("../results/total_infected.png", dpi=300)
+    plt.close()
@@ -0,0 +1,103 @@
+import numpy as np
+from scipy import sparse
+from scipy.integrate import solve_ivp
+
+class SEIRModel:
+    def __init__(self, C, N, beta, sigma, gamma):
+        """
+        Age/region-structured SEIR model for any number of groups, with
+        several parameter scenarios solved side by side.
+
+        C: (n_groups, n_groups) contact matrix, dense or scipy.sparse
+           (rows = infectee, cols = infector, as in seir_age_structured)
+        N: population per group, shape (n_groups,)
+        beta, sigma, gamma: scalars, or arrays with one value per scenario
+
+        The state is the flattened (4, n_groups, n_scenarios) array of
+        S, E, I, R. The force of infection is one sparse product for all
+        scenarios, C @ (I / N), and derivatives are written in place into
+        an output buffer (preallocated for the fixed-step RK4 stages)
+        instead of being split and concatenated.
+        """
+        self.C = sparse.csr_matrix(C)
+        self.N = np.asarray(N, dtype=float)
+        self.beta, self.sigma, self.gamma = (np.atleast_1d(np.asarray(p, dtype=float))
+                                             for p in (beta, sigma, gamma))
+        self.n_groups = self.N.size
+        self.n_scenarios = max(p.size for p in (self.beta, self.sigma, self.gamma))
+        self.shape = (4, self.n_groups, self.n_scenarios)
+        self._inv_N = (1.0 / self.N)[:, None]
+
+    def initial_state(self, E0, I0, R0=0.0):
+        """Flat y0 with the same initial E, I, R (per group) in every scenario."""
+        y0 = np.empty(self.shape)
+        y0[1] = np.broadcast_to(np.reshape(E0, (-1, 1)), self.shape[1:])
+        y0[2] = np.broadcast_to(np.reshape(I0, (-1, 1)), self.shape[1:])
+        y0[3] = np.broadcast_to(np.reshape(R0, (-1, 1)), self.shape[1:])
+        y0[0] = self.N[:, None] - y0[1] - y0[2] - y0[3]
+        return y0.ravel()
+
+    def rhs(self, t, y, out=None):
+        """
+        Time derivative of the flat state, written into out (a flat
+        buffer of the state's size) when given. Everything is computed in
+        place, so only the force of infection allocates.
+        """
+        S, E, I, R = y.reshape(self.shape)
+        if out is None:
+            out = np.empty(y.size)
+        dS, dE, dI, dR = out.reshape(self.shape)
+
+        # Force of infection per group and scenario: beta * C @ (I / N)
+        np.multiply(self.C @ (I * self._inv_N), self.beta, out=dE)
+        np.multiply(dE, S, out=dE)
+        np.negative(dE, out=dS)
+        np.multiply(self.sigma, E, out=dI)
+        dE -= dI
+        np.multiply(self.gamma, I, out=dR)
+        dI -= dR
+        return out
+
+    def _rk4(self, y0, t_eval, substeps):
+        # Fixed-step RK4 on t_eval with preallocated stage buffers
+        y = np.array(y0, dtype=float)
+        k1, k2, k3, k4, stage = (np.empty_like(y) for _ in range(5))
+        out = np.empty((y.size, len(t_eval)))
+        out[:, 0] = y
+        for j in range(1, len(t_eval)):
+            h = (t_eval[j] - t_eval[j - 1]) / substeps
+            t = t_eval[j - 1]
+            for _ in range(substeps):
+                self.rhs(t, y, k1)
+                np.multiply(k1, h / 2, out=stage)
+                stage += y
+                self.rhs(t + h / 2, stage, k2)
+                np.multiply(k2, h / 2, out=stage)
+                stage += y
+                self.rhs(t + h / 2, stage, k3)
+                np.multiply(k3, h, out=stage)
+                stage += y
+                self.rhs(t + h, stage, k4)
+                k2 += k3
+                k2 *= 2
+                k1 += k2
+                k1 += k4
+                k1 *= h / 6
+                y += k1
+                t += h
+            out[:, j] = y
+        return out
+
+    def solve(self, y0, t_eval, method="RK45", substeps=4, **solver_options):
+        """
+        Integrate over t_eval with solve_ivp, or with fixed-step RK4
+        (substeps per interval of t_eval) for method="rk4". Returns t and
+        the states, shape (4, n_groups, n_scenarios, len(t)).
+        """
+        if method == "rk4":
+            t, y = np.asarray(t_eval), self._rk4(y0, t_eval, substeps)
+        else:
+            sol = solve_ivp(self.rhs, (t_eval[0], t_eval[-1]), y0, method=method,
+                            t_eval=t_eval, **solver_options)
+            t, y = sol.t, sol.y
+        return t, y.reshape(self.shape + (t.size,))
@@ -0,0 +1,101 @@
+"""
+Timing benchmarks for the stochastic SIR models.
+
+Run from src/:  python benchmarks.py
+"""
+import time
+import numpy as np
+
+import stochastic_sir_monte_carlo as sir
+from parallel_monte_carlo import run_parallel_monte_carlo
+from gillespie import simulate_runs
+
+def _best_time(func, *args, repeat=3):
+    best = np.inf
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def bench_ensemble(sizes=(10**4, 10**5, 10**6)):
+    """
+    simulate_one_run in a loop vs simulate_ensemble at the script's
+    n_runs, then ensemble_outcomes (no trajectories kept) at larger sizes.
+    """
+    np.random.seed(0)
+    t_loop = _best_time(lambda: [sir.simulate_one_run() for _ in range(sir.n_runs)])
+    t_ensemble = _best_time(sir.simulate_ensemble, sir.n_runs, 0)
+    print(f"Chain-binomial SIR, N = {sir.N}, T = {sir.T}")
+    print(f"  {sir.n_runs} runs, loop        {1e3 * t_loop:9.1f} ms")
+    print(f"  {sir.n_runs} runs, ensemble    {1e3 * t_ensemble:9.1f} ms  ({t_loop / t_ensemble:.0f}x)")
+
+    for n_runs in sizes:
+        start = time.perf_counter()
+        R_final, I_peak = sir.ensemble_outcomes(n_runs, 1)
+        elapsed = time.perf_counter() - start
+        print(f"  {n_runs:>8} runs, outcomes  {elapsed:8.2f} s  "
+              f"({1e6 * elapsed / n_runs:.1f} us/run, mean final size {R_final.mean():.0f})")
+
+def bench_parallel(n_runs=400_000, seed=7, workers=(1, 2, 4)):
+    """
+    Seed-partitioned process-pool Monte Carlo; the merged summaries must
+    be identical for every worker count.
+    """
+    print(f"Parallel Monte Carlo, {n_runs} runs")
+    reference = None
+    for n_workers in workers:
+        start = time.perf_counter()
+        summary = run_parallel_monte_carlo(n_runs, seed, n_workers)
+        elapsed = time.perf_counter() - start
+        if reference is None:
+            reference = summary
+        assert all(np.array_equal(summary[key], reference[key]) for key in reference)
+        print(f"  {n_workers} worker(s)  {elapsed:7.2f} s  "
+              f"P(extinction) = {summary['extinction_probability']:.5f}")
+
+def final_size_fraction(R0_basic, n_iter=200):
+    """Deterministic final size z of a major outbreak: z = 1 - exp(-R0 z)."""
+    z = 1.0
+    for _ in range(n_iter):
+        z = 1.0 - np.exp(-R0_basic * z)
+    return z
+
+def bench_engines(sizes=(10**3, 10**4, 10**5, 10**6, 10**7), ssa_limit=10**6, seed=3):
+    """
+    Cost per replicate and mean final size (fraction of N, major outbreaks)
+    for the exact SSA, adaptive tau-leaping and the daily chain-binomial
+    model. SSA cost grows with the number of events (~2N), so it is only
+    run up to ssa_limit.
+    """
+    z = final_size_fraction(sir.beta / sir.gamma)
+    print(f"SSA vs tau-leaping vs chain-binomial (deterministic final size {z:.4f})")
+    print(f"{'N':>9} {'runs':>5} {'SSA [ms/run]':>13} {'tau [ms/run]':>13} {'chain [ms/run]':>15} "
+          f"{'z SSA':>7} {'z tau':>7} {'z chain':>8}")
+
+    def timed(method, n_runs, N):
+        start = time.perf_counter()
+        if method == "chain":
+            R = sir.simulate_ensemble(n_runs, seed, N=N)[2]
+        else:
+            R = simulate_runs(n_runs, method, seed, N=N)[2]
+        elapsed = 1e3 * (time.perf_counter() - start) / n_runs
+        final = R[:, -1] / N
+        return elapsed, final[final > 0.5].mean()
+
+    for N in sizes:
+        n_runs = max(2, min(200, 10**7 // (20 * N)))
+        t_tau, z_tau = timed("tau", n_runs, N)
+        t_chain, z_chain = timed("chain", n_runs, N)
+        if N <= ssa_limit:
+            t_ssa, z_ssa = timed("ssa", n_runs, N)
+            ssa = f"{t_ssa:>13.2f}"
+            ssa_z = f"{z_ssa:>7.4f}"
+        else:
+            ssa, ssa_z = f"{'-':>13}", f"{'-':>7}"
+        print(f"{N:>9} {n_runs:>5} {ssa} {t_tau:>13.2f} {t_chain:>15.2f} {ssa_z} {z_tau:>7.4f} {z_chain:>8.4f}")
+
+if __name__ == "__main__":
+    bench_ensemble()
+    bench_parallel()
+    bench_engines()
@@ -0,0 +1,78 @@
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+import stochastic_sir_monte_carlo as sir
+
+# Replicates per independent random stream; fixes the streams, so results
+# do not depend on how batches are spread over workers
+BATCH_SIZE = 50_000
+N_BINS = 1000
+# Outbreaks whose final size stays below this fraction of N count as
+# early extinction (minor outbreaks)
+MINOR_OUTBREAK_FRACTION = 0.05
+
+def _bin(values, N, n_bins):
+    # Integer binning of 0..N into n_bins equal bins
+    return np.bincount(values.astype(np.int64) * n_bins // (N + 1), minlength=n_bins)
+
+def summarize_batch(n_runs, seed, N=sir.N, beta=sir.beta, gamma=sir.gamma,
+                    I0=sir.I0, R0=sir.R0, T=sir.T, n_bins=N_BINS):
+    """
+    Run one batch with ensemble_outcomes and reduce it to integer counts:
+    histograms of final size R(T) and peak I over 0..N, and the number of
+    minor outbreaks.
+    """
+    R_final, I_peak = sir.ensemble_outcomes(n_runs, seed, N, beta, gamma, I0, R0, T)
+    return {
+        "runs": n_runs,
+        "final_size_counts": _bin(R_final, N, n_bins),
+        "peak_counts": _bin(I_peak, N, n_bins),
+        "extinct": int(np.count_nonzero(R_final < MINOR_OUTBREAK_FRACTION * N)),
+    }
+
+def merge_summaries(summaries):
+    """
+    Add up batch summaries; exact, since everything is a count. The
+    extinction probability is NaN if the summaries hold no runs.
+    """
+    if not summaries:
+        raise ValueError("No summaries to merge")
+    merged = {
+        "runs": sum(s["runs"] for s in summaries),
+        "final_size_counts": np.sum([s["final_size_counts"] for s in summaries], axis=0),
+        "peak_counts": np.sum([s["peak_counts"] for s in summaries], axis=0),
+        "extinct": sum(s["extinct"] for s in summaries),
+    }
+    merged["extinction_probability"] = (merged["extinct"] / merged["runs"]
+                                        if merged["runs"] else float("nan"))
+    return merged
+
+def _summarize_batches(batch_sizes, seeds, params):
+    return [summarize_batch(n, seed, **params) for n, seed in zip(batch_sizes, seeds)]
+
+def run_parallel_monte_carlo(n_runs, seed, n_workers=4, batch_size=BATCH_SIZE, **params):
+    """
+    Chain-binomial SIR Monte Carlo across a process pool.
+
+    Replicates are split into batches of batch_size, each drawing from its
+    own child of SeedSequence(seed); workers return only the reduced batch
+    summaries. Because the streams are tied to batches and the summaries
+    are counts, the result is the same for any n_workers.
+
+    params are passed to summarize_batch (N, beta, gamma, I0, R0, T, n_bins).
+    Returns the merged summary; bin i of the histograms covers values
+    [i (N+1) / n_bins, (i+1) (N+1) / n_bins).
+    """
+    if n_runs < 1:
+        raise ValueError(f"n_runs must be positive, got {n_runs}")
+    batch_sizes = [min(batch_size, n_runs - start) for start in range(0, n_runs, batch_size)]
+    seeds = np.random.SeedSequence(seed).spawn(len(batch_sizes))
+    bounds = np.linspace(0, len(batch_sizes), n_workers + 1).astype(int)
+
+    with ProcessPoolExecutor(max_workers=n_workers) as pool:
+        futures = [pool.submit(_summarize_batches, batch_sizes[lo:hi], seeds[lo:hi], params)
+                   for lo, hi in zip(bounds[:-1], bounds[1:]) if hi > lo]
+        summaries = [s for f in futures for s in f.result()]
+
+    return merge_summaries(summaries)
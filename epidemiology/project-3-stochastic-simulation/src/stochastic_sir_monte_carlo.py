@@ -2,9 +2,6 @@ import numpy as np
 import matplotlib.pyplot as plt
 import os
 
-os.makedirs("../results", exist_ok=True)
-os.makedirs("../data", exist_ok=True)
-
 N = 10000
 beta = 0.3
 gamma = 1/10
@@ -47,35 +44,111 @@ def simulate_one_run():
 
     return np.array(S_traj), np.array(I_traj), np.array(R_traj)
 
-final_sizes = []
-sample_trajectories = []
-
-for run in range(n_runs):
-    S_traj, I_traj, R_traj = simulate_one_run()
-    final_sizes.append(R_traj[-1])
-    if run < 5:
-        sample_trajectories.append((S_traj, I_traj, R_traj))
-
-final_sizes = np.array(final_sizes)
-np.savetxt("../data/final_sizes.csv", final_sizes, delimiter=",", header="final_size", comments="")
-
-plt.figure(figsize=(8, 6))
-for (S_traj, I_traj, R_traj) in sample_trajectories:
-    t = np.arange(len(I_traj))
-    plt.plot(t, I_traj, alpha=0.7)
-plt.xlabel("Time (days)")
-plt.ylabel("Infected individuals")
-plt.title("Sample Stochastic Epidemic Trajectories")
-plt.grid(alpha=0.3)
-plt.tight_layout()
-plt.savefig("../results/sample_trajectories.png", dpi=300)
-plt.close()
-
-plt.figure(figsize=(8, 6))
-plt.hist(final_sizes, bins=20, edgecolor="black", alpha=0.8)
-plt.xlabel("Final outbreak size (R(T))")
-plt.ylabel("Frequency")
-plt.title("Distribution of Final Outbreak Sizes (Monte Carlo)")
-plt.tight_layout()
-plt.savefig("../results/final_size_distribution.png", dpi=300)
-plt.close()
+def simulate_ensemble(n_runs, rng=None, N=N, beta=beta, gamma=gamma, I0=I0, R0=R0, T=T):
+    """
+    Advance n_runs chain-binomial trajectories together, one array-valued
+    binomial draw per compartment and day. Runs with I == 0 are extinct
+    and masked out of the draws. Returns S, I, R as int32 arrays of
+    shape (n_runs, T + 1).
+    """
+    rng = np.random.default_rng(rng)
+    S = np.full(n_runs, N - I0 - R0, dtype=np.int32)
+    I = np.full(n_runs, I0, dtype=np.int32)
+    R = np.full(n_runs, R0, dtype=np.int32)
+
+    S_traj = np.empty((n_runs, T + 1), dtype=np.int32)
+    I_traj = np.empty((n_runs, T + 1), dtype=np.int32)
+    R_traj = np.empty((n_runs, T + 1), dtype=np.int32)
+    S_traj[:, 0] = S
+    I_traj[:, 0] = I
+    R_traj[:, 0] = R
+
+    p_rec = 1 - np.exp(-gamma)
+    active = np.flatnonzero(I)
+    for t in range(T):
+        if active.size == 0:
+            # Every run is extinct: the state stays fixed
+            S_traj[:, t + 1:] = S[:, None]
+            I_traj[:, t + 1:] = 0
+            R_traj[:, t + 1:] = R[:, None]
+            break
+
+        S_a = S[active]
+        I_a = I[active]
+        p_inf = 1 - np.exp(-beta * I_a / N)
+        new_inf = rng.binomial(S_a, p_inf)
+        new_rec = rng.binomial(I_a, p_rec)
+
+        S[active] = S_a - new_inf
+        I_a = I_a + new_inf - new_rec
+        I[active] = I_a
+        R[active] += new_rec
+        active = active[I_a > 0]
+
+        S_traj[:, t + 1] = S
+        I_traj[:, t + 1] = I
+        R_traj[:, t + 1] = R
+
+    return S_traj, I_traj, R_traj
+
+def ensemble_outcomes(n_runs, rng=None, N=N, beta=beta, gamma=gamma, I0=I0, R0=R0, T=T):
+    """
+    Same model as simulate_ensemble, keeping only the current state, so
+    memory is O(n_runs) for any T. Returns final R and peak I per run.
+    """
+    rng = np.random.default_rng(rng)
+    S = np.full(n_runs, N - I0 - R0, dtype=np.int32)
+    I = np.full(n_runs, I0, dtype=np.int32)
+    R = np.full(n_runs, R0, dtype=np.int32)
+    I_peak = I.copy()
+
+    p_rec = 1 - np.exp(-gamma)
+    active = np.flatnonzero(I)
+    for t in range(T):
+        if active.size == 0:
+            break
+        S_a = S[active]
+        I_a = I[active]
+        p_inf = 1 - np.exp(-beta * I_a / N)
+        new_inf = rng.binomial(S_a, p_inf)
+        new_rec = rng.binomial(I_a, p_rec)
+
+        S[active] = S_a - new_inf
+        I_a = I_a + new_inf - new_rec
+        I[active] = I_a
+        R[active] += new_rec
+        I_peak[active] = np.maximum(I_peak[active], I_a)
+        active = active[I_a > 0]
+
+    return R, I_peak
+
+if __name__ == "__main__":
+    os.makedirs("../results", exist_ok=True)
+    os.makedirs("../data", exist_ok=True)
+
+    S_all, I_all, R_all = simulate_ensemble(n_runs)
+    final_sizes = R_all[:, -1]
+    sample_trajectories = list(zip(S_all[:5], I_all[:5], R_all[:5]))
+
+    np.savetxt("../data/final_sizes.csv", final_sizes, delimiter=",", header="final_size", comments="")
+
+    plt.figure(figsize=(8, 6))
+    for (S_traj, I_traj, R_traj) in sample_trajectories:
+        t = np.arange(len(I_traj))
+        plt.plot(t, I_traj, alpha=0.7)
+    plt.xlabel("Time (days)")
+    plt.ylabel("Infected individuals")
+    plt.title("Sample Stochastic Epidemic Trajectories")
+    plt.grid(alpha=0.3)
+    plt.tight_layout()
+    plt.savefig("../results/sample_trajectories.png", dpi=300)
+    plt.close()
+
+    plt.figure(figsize=(8, 6))
+    plt.hist(final_sizes, bins=20, edgecolor="black", alpha=0.8)
+    plt.xlabel("Final outbreak size (R(T))")
+    plt.ylabel("Frequency")
+    plt.title("Distribution of Final Outbreak Sizes (Monte Carlo)")
+    plt.tight_layout()
+    plt.savefig("../results/final_size_distribution.png", dpi=300)
+    plt.close()
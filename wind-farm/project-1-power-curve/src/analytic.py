@@ -0,0 +1,125 @@
+import numpy as np
+from scipy.special import gamma, gammainc
+
+from simulation import load_power_curve
+
+HOURS_PER_YEAR = 8760
+
+
+def weibull_cdf(v, k, c):
+    """Weibull CDF F(v) = 1 - exp(-(v/c)^k), for v >= 0."""
+    return -np.expm1(-(np.maximum(v, 0.0) / c) ** k)
+
+
+def weibull_partial_mean(v, k, c):
+    """Partial first moment E[V; V <= v] = c Γ(1 + 1/k) P(1 + 1/k, (v/c)^k).
+
+    P is the regularized lower incomplete gamma function.
+    """
+    a = 1.0 + 1.0 / k
+    return c * gamma(a) * gammainc(a, (np.maximum(v, 0.0) / c) ** k)
+
+
+def _segments(power_curve: dict):
+    """Power curve as constant/linear pieces covering [0, inf).
+
+    Outside the table np.interp holds the end values, so the curve is
+    extended with constant pieces below the first and above the last speed.
+    Returns (v0, v1, p0, p1) arrays, one entry per piece.
+    """
+    speed = np.asarray(power_curve["speed"], dtype=float)
+    power = np.asarray(power_curve["power"], dtype=float)
+    v0 = np.concatenate(([0.0], speed))
+    v1 = np.concatenate((speed, [np.inf]))
+    p0 = np.concatenate(([power[0]], power))
+    p1 = np.concatenate((power, [power[-1]]))
+    return v0, v1, p0, p1
+
+
+def _broadcast_sites(k, c):
+    k, c = np.broadcast_arrays(np.asarray(k, dtype=float), np.asarray(c, dtype=float))
+    return k[..., None], c[..., None]
+
+
+def expected_power(k, c, power_curve: dict = None) -> np.ndarray:
+    """Mean power [kW] of the power curve under Weibull(k, c) wind.
+
+    Exact for the piecewise-linear curve: on a piece P(v) = p0 + s (v - v0)
+    the integral is (p0 - s v0) ΔF + s ΔE[V; V <= v], with the Weibull CDF
+    and partial mean in closed form. k and c broadcast, so arrays of sites
+    are evaluated at once.
+    """
+    if power_curve is None:
+        power_curve = load_power_curve()
+    v0, v1, p0, p1 = _segments(power_curve)
+    k, c = _broadcast_sites(k, c)
+
+    sloped = np.isfinite(v1) & (v1 > v0)
+    slope = np.where(sloped, (p1 - p0) / np.where(sloped, v1 - v0, 1.0), 0.0)
+    probability = weibull_cdf(v1, k, c) - weibull_cdf(v0, k, c)
+    partial_mean = np.where(slope != 0,
+                            weibull_partial_mean(v1, k, c) - weibull_partial_mean(v0, k, c), 0.0)
+    return np.sum((p0 - slope * v0) * probability + slope * partial_mean, axis=-1)
+
+
+def capacity_factor(k, c, power_curve: dict = None) -> np.ndarray:
+    """Expected power as a fraction of rated (maximum) power."""
+    if power_curve is None:
+        power_curve = load_power_curve()
+    return expected_power(k, c, power_curve) / np.max(power_curve["power"])
+
+
+def annual_energy(k, c, power_curve: dict = None, hours: float = HOURS_PER_YEAR) -> np.ndarray:
+    """Expected annual energy production [kWh]."""
+    return hours * expected_power(k, c, power_curve)
+
+
+def power_cdf(p, k, c, power_curve: dict = None) -> np.ndarray:
+    """Probability that the power output is at most p [kW].
+
+    Sums, over the pieces of the curve, the Weibull probability of the
+    speeds whose power is <= p. p, k and c broadcast.
+    """
+    if power_curve is None:
+        power_curve = load_power_curve()
+    v0, v1, p0, p1 = _segments(power_curve)
+    p = np.asarray(p, dtype=float)[..., None]
+    k, c = _broadcast_sites(k, c)
+
+    # Speed on each piece where the power crosses p, clipped to the piece
+    rising = p1 > p0
+    falling = p1 < p0
+    dp = np.where(p1 != p0, p1 - p0, 1.0)
+    crossing = np.clip(v0 + (p - p0) / dp * np.where(np.isfinite(v1), v1 - v0, 0.0), v0, v1)
+
+    lo = np.where(rising, v0, np.where(falling, crossing, v0))
+    hi = np.where(rising, crossing, v1)
+    flat_above = ~rising & ~falling & (p0 > p)
+    hi = np.where(flat_above, lo, hi)
+    return np.sum(weibull_cdf(hi, k, c) - weibull_cdf(lo, k, c), axis=-1)
+
+
+def exceedance_power(exceedance, k, c, power_curve: dict = None, tol: float = 1e-9) -> np.ndarray:
+    """Power [kW] exceeded with the given probability in percent (P50, P90, ...).
+
+    P_x is the (100 - x)th percentile of the power distribution, found by
+    bisection on power_cdf simultaneously for all sites and levels. The
+    result has shape broadcast(exceedance, k, c).
+    """
+    if power_curve is None:
+        power_curve = load_power_curve()
+    q = 1.0 - np.asarray(exceedance, dtype=float) / 100.0
+    q, k, c = np.broadcast_arrays(q, np.asarray(k, dtype=float), np.asarray(c, dtype=float))
+
+    p_min = float(np.min(power_curve["power"]))
+    lo = np.full(q.shape, p_min)
+    hi = np.full(q.shape, float(np.max(power_curve["power"])))
+    # Smallest p with power_cdf(p) >= q; halve the bracket until below tol
+    n_iter = int(np.ceil(np.log2(max(hi.max() - lo.min(), tol) / tol)))
+    for _ in range(n_iter):
+        mid = 0.5 * (lo + hi)
+        below = power_cdf(mid, k, c, power_curve) < q
+        lo = np.where(below, mid, lo)
+        hi = np.where(below, hi, mid)
+    # Point mass at the minimum power (below cut-in, above cut-out)
+    return np.where(power_cdf(p_min, k, c, power_curve) >= q, p_min, hi)
@@ -0,0 +1,212 @@
+"""
+Timing benchmarks for the power curve simulation.
+
+Run from src/:  python benchmarks.py
+"""
+import os
+import time
+import numpy as np
+from scipy.integrate import quad
+
+from simulation import (load_power_curve, simulate_power_output, run_simulation,
+                        run_simulation_streaming, run_simulation_parallel)
+from power_table import PowerCurveTable
+from analytic import expected_power, power_cdf, exceedance_power
+
+
+def _best_time(func, *args, repeat=3):
+    best = np.inf
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def synthetic_fleet(n_models: int, seed: int = 0, step: float = None) -> list:
+    """Power curves scaled from load_power_curve.
+
+    With step=None each curve has its own number of evenly spaced points
+    over 0-25 m/s (ragged grids); otherwise curves are tabulated every
+    step or 2 * step m/s up to a cut-out of 20, 22 or 25 m/s.
+    """
+    rng = np.random.default_rng(seed)
+    base = load_power_curve()
+    curves = []
+    for _ in range(n_models):
+        if step is None:
+            speed = np.linspace(0, 25, int(rng.integers(6, 30)))
+        else:
+            spacing = step * rng.choice([1, 2])
+            speed = spacing * np.arange(int(rng.choice([20, 22, 25]) / spacing) + 1)
+        rated = rng.uniform(1500, 8000)
+        power = np.interp(speed * rng.uniform(0.9, 1.1), base["speed"], base["power"]) * rated / 2000
+        curves.append({"speed": speed, "power": power})
+    return curves
+
+
+def bench_power_table(n_models=300, n_sites=2000, n_samples=1000):
+    """
+    One model per site: np.interp per site vs PowerCurveTable.evaluate,
+    for evenly spaced curves with ragged point counts and curves tabulated
+    every 0.5/1 m/s (both indexed directly), the ragged curves with one
+    irregular curve added (one np.interp over all models).
+    """
+    rng = np.random.default_rng(1)
+    models = rng.integers(0, n_models, n_sites)
+    wind_speeds = rng.weibull(2.0, (n_sites, n_samples)) * rng.uniform(5, 11, (n_sites, 1))
+    print(f"Power curves: {n_models} models, {n_sites} sites x {n_samples} samples")
+
+    ragged = synthetic_fleet(n_models)
+    fleets = {
+        "evenly spaced, ragged point counts": ragged,
+        "tabulated every 0.5/1 m/s": synthetic_fleet(n_models, step=0.5),
+        "ragged + one irregular curve": ragged[:-1] + [load_power_curve()],
+    }
+    for label, curves in fleets.items():
+        table = PowerCurveTable.from_curves(curves)
+
+        def per_site():
+            return np.array([simulate_power_output(wind_speeds[i], curves[m]) for i, m in enumerate(models)])
+
+        reference = per_site()
+        assert np.allclose(table.evaluate(wind_speeds, models[:, None]), reference, rtol=1e-12, atol=1e-6)
+        t_loop = _best_time(per_site)
+        t_table = _best_time(table.evaluate, wind_speeds, models[:, None])
+        path = "direct index" if table.evenly_spaced else "one np.interp"
+        print(f"  {label}")
+        print(f"    np.interp per site     {t_loop:8.4f} s")
+        print(f"    table, {path:<15} {t_table:8.4f} s  ({t_loop / t_table:.1f}x)")
+
+
+def bench_fleet_matrix(n_models=300, n_sites=200, n_samples=100):
+    """
+    Every model at every site (models=None): one np.interp call per
+    (model, site) vs a single PowerCurveTable.evaluate.
+    """
+    rng = np.random.default_rng(2)
+    curves = synthetic_fleet(n_models)
+    wind_speeds = rng.weibull(2.0, (n_sites, n_samples)) * rng.uniform(5, 11, (n_sites, 1))
+    table = PowerCurveTable.from_curves(curves)
+
+    def per_pair():
+        return np.array([[simulate_power_output(site, curve) for site in wind_speeds] for curve in curves])
+
+    assert np.allclose(table.evaluate(wind_speeds), per_pair(), rtol=1e-12, atol=1e-6)
+    t_loop = _best_time(per_pair)
+    t_table = _best_time(table.evaluate, wind_speeds)
+    print(f"All models x all sites: {n_models} models, {n_sites} sites x {n_samples} samples")
+    print(f"  np.interp per pair     {t_loop:8.4f} s")
+    path = "direct index" if table.evenly_spaced else "one np.interp"
+    print(f"  table, {path:<15} {t_table:8.4f} s  ({t_loop / t_table:.1f}x)")
+
+
+def weibull_pdf(v, k, c):
+    return k / c * (v / c) ** (k - 1) * np.exp(-(v / c) ** k)
+
+
+def quad_expected_power(k, c, curve):
+    """Mean power by adaptive quadrature, split at the curve's breakpoints."""
+    edges = np.concatenate(([0.0], curve["speed"], [np.inf]))
+    return sum(quad(lambda v: simulate_power_output(v, curve) * weibull_pdf(v, k, c), a, b)[0]
+               for a, b in zip(edges[:-1], edges[1:]))
+
+
+def bench_analytic(n_sites=10_000, n_checked=20, seed=4):
+    """
+    Closed-form Weibull integrals vs scipy.integrate.quad. expected_power
+    is compared with the quadrature mean; power_cdf through
+    E[P] = integral of (1 - F_P(p)) dp over [0, P_max]; exceedance_power
+    must invert power_cdf. Then the cost per site of each.
+    """
+    rng = np.random.default_rng(seed)
+    curve = load_power_curve()
+    p_max = float(np.max(curve["power"]))
+    k = rng.uniform(1.5, 3.0, n_sites)
+    c = rng.uniform(5.0, 11.0, n_sites)
+
+    error_mean = error_cdf = 0.0
+    for i in range(n_checked):
+        mean = expected_power(k[i], c[i], curve)
+        error_mean = max(error_mean, abs(mean - quad_expected_power(k[i], c[i], curve)) / p_max)
+        tail = quad(lambda p: 1.0 - power_cdf(p, k[i], c[i], curve), 0.0, p_max,
+                    epsabs=1e-12, epsrel=1e-12, limit=200)[0]
+        error_cdf = max(error_cdf, abs(mean - tail) / p_max)
+    assert error_mean < 1e-10 and error_cdf < 1e-10
+
+    levels = np.array([50.0, 90.0])[:, None]
+    p = exceedance_power(levels, k[:n_checked], c[:n_checked], curve)
+    q = 1.0 - levels / 100.0
+    assert np.all(power_cdf(p, k[:n_checked], c[:n_checked], curve) >= q - 1e-12)
+    assert np.all((p == np.min(curve["power"])) |
+                  (power_cdf(p - 1e-6, k[:n_checked], c[:n_checked], curve) < q))
+
+    t_quad = _best_time(lambda: [quad_expected_power(k[i], c[i], curve) for i in range(n_checked)]) / n_checked
+    t_mean = _best_time(expected_power, k, c, curve) / n_sites
+    t_exceed = _best_time(exceedance_power, levels, k, c, curve) / n_sites
+    print(f"Closed-form Weibull integrals ({n_checked} sites checked against quad)")
+    print(f"  max error, expected_power        {error_mean:.1e} x P_max")
+    print(f"  max error, power_cdf (via E[P])  {error_cdf:.1e} x P_max")
+    print(f"  quad, expected power             {1e6 * t_quad:10.2f} us/site")
+    print(f"  expected_power                   {1e6 * t_mean:10.2f} us/site ({n_sites} sites)")
+    print(f"  exceedance_power P50 + P90       {1e6 * t_exceed:10.2f} us/site")
+
+
+def bench_streaming(size=5_000_000, chunk_size=500_000, seed=3):
+    """
+    In-memory run_simulation vs run_simulation_streaming on the same random
+    stream: mean and variance must agree to rounding, and the sketch's
+    P10/P50/P90 must lie within one bin of np.percentile.
+    """
+    start = time.perf_counter()
+    power = run_simulation(2.0, 8.0, size, rng=seed)
+    t_memory = time.perf_counter() - start
+    start = time.perf_counter()
+    stats = run_simulation_streaming(2.0, 8.0, size, chunk_size, rng=seed)
+    t_stream = time.perf_counter() - start
+
+    assert stats.count == size
+    assert np.isclose(stats.mean, power.mean(), rtol=1e-12, atol=0)
+    assert np.isclose(stats.variance, power.var(ddof=1), rtol=1e-10, atol=0)
+    exceedance = np.array([10, 50, 90])
+    sketched = np.array([stats.exceedance(p) for p in exceedance])
+    exact = np.percentile(power, 100 - exceedance)
+    assert np.all(np.abs(sketched - exact) <= stats.sketch.bin_width)
+
+    print(f"Streaming vs in-memory simulation, {size:.0e} samples, chunks of {chunk_size:.0e}")
+    print(f"  in memory         {t_memory:8.3f} s  ({power.nbytes / 2**20:.0f} MiB of samples)")
+    print(f"  streaming         {t_stream:8.3f} s")
+    for p, approx, value in zip(exceedance, sketched, exact):
+        print(f"  P{p:<2} sketch {approx:9.3f} kW, np.percentile {value:9.3f} kW")
+    print(f"  (sketch bin width {stats.sketch.bin_width:.3f} kW)")
+
+
+def bench_parallel(size=20_000_000, seed=42, workers=(1, 2, 4)):
+    """
+    Streaming simulation in one process vs the process pool, checking
+    that repeated parallel runs give identical statistics.
+    """
+    # No samples: both paths return empty statistics
+    empty = run_simulation_parallel(2.0, 8.0, 0, seed, 2)
+    assert empty.count == 0 and empty.summary() == run_simulation_streaming(2.0, 8.0, 0, rng=seed).summary()
+
+    print(f"Streaming simulation, {size:.0e} samples ({os.cpu_count()} CPUs)")
+    start = time.perf_counter()
+    run_simulation_streaming(2.0, 8.0, size, rng=seed)
+    print(f"  serial            {time.perf_counter() - start:8.3f} s")
+
+    for n_workers in workers:
+        start = time.perf_counter()
+        first = run_simulation_parallel(2.0, 8.0, size, seed, n_workers)
+        elapsed = time.perf_counter() - start
+        again = run_simulation_parallel(2.0, 8.0, size, seed, n_workers)
+        assert first.summary() == again.summary() and np.array_equal(first.hist, again.hist)
+        print(f"  {n_workers} worker(s)       {elapsed:8.3f} s  mean {first.mean:.6f} kW")
+
+
+if __name__ == "__main__":
+    bench_power_table()
+    bench_fleet_matrix()
+    bench_analytic()
+    bench_streaming()
+    bench_parallel()
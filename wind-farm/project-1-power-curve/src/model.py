@@ -1,6 +1,6 @@
 import numpy as np
 
-def generate_wind_speeds(k: float, c: float, size: int = 10000) -> np.ndarray:
+def generate_wind_speeds(k: float, c: float, size: int = 10000, rng=None) -> np.ndarray:
     """
     Generate wind speeds using a Weibull distribution.
 
@@ -12,10 +12,15 @@ def generate_wind_speeds(k: float, c: float, size: int = 10000) -> np.ndarray:
         Scale parameter of the Weibull distribution.
     size : int
         Number of samples to generate.
+    rng : numpy.random.Generator, int or SeedSequence, optional
+        Source of randomness; a seed is passed to np.random.default_rng.
+        If omitted the global np.random state is used.
 
     Returns
     -------
     np.ndarray
         Array of simulated wind speeds.
     """
-    return np.random.weibull(k, size) * c
\ No newline at end of file
+    if rng is None:
+        return np.random.weibull(k, size) * c
+    return np.random.default_rng(rng).weibull(k, size) * c
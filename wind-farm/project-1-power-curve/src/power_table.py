@@ -0,0 +1,108 @@
+import numpy as np
+
+
+class PowerCurveTable:
+    """Power curves of many turbine models on one shared speed grid.
+
+    power[m, j] is the output [kW] of model m at speed[j]. Evaluation is
+    linear interpolation with the end values held outside each curve, i.e.
+    np.interp, applied to any mix of models and sites in one call.
+    """
+
+    def __init__(self, speed: np.ndarray, power: np.ndarray):
+        self.speed = np.asarray(speed, dtype=float)
+        self.power = np.atleast_2d(np.asarray(power, dtype=float))
+        self._set_breakpoints([self.speed] * len(self), self.power)
+
+    def _set_breakpoints(self, speeds, powers):
+        # Per-model breakpoints used by evaluate, flattened model after model
+        speeds = [np.asarray(v, dtype=float) for v in speeds]
+        powers = [np.asarray(p, dtype=float) for p in powers]
+        self._start = np.array([v[0] for v in speeds])
+        self._end = np.array([v[-1] for v in speeds])
+        self._base = np.cumsum([0] + [v.size for v in speeds[:-1]])
+        self._values = np.concatenate(powers)
+
+        steps = [np.diff(v) for v in speeds]
+        self.evenly_spaced = all(d.size > 0 and np.allclose(d, d[0], rtol=1e-12, atol=0) for d in steps)
+        if self.evenly_spaced:
+            # Indexed directly: P = power + t * rise, t in [0, 1) within an
+            # interval; the last point of each curve has rise 0
+            self._inv_step = np.array([1.0 / d[0] for d in steps])
+            self._last = np.array([v.size - 1 for v in speeds])
+            self._rise = np.concatenate([np.append(np.diff(p), 0.0) for p in powers])
+        else:
+            # Model m's breakpoints shifted by m * _span into one increasing
+            # array, so a single np.interp serves any mix of models
+            self._span = (self._end - self._start).max() + 1.0
+            self._keys = np.concatenate([m * self._span + (v - v[0]) for m, v in enumerate(speeds)])
+
+    @classmethod
+    def from_curves(cls, curves: list) -> "PowerCurveTable":
+        """Stack power curve dicts ({"speed", "power"}) with ragged grids.
+
+        Every curve is resampled onto the union of all breakpoints. A
+        piecewise-linear curve is unchanged by adding breakpoints, so the
+        table reproduces each curve exactly. Evaluation interpolates each
+        curve on its own breakpoints.
+        """
+        speed = np.unique(np.concatenate([np.asarray(c["speed"], dtype=float) for c in curves]))
+        power = np.array([np.interp(speed, c["speed"], c["power"]) for c in curves])
+        table = cls(speed, power)
+        table._set_breakpoints([c["speed"] for c in curves], [c["power"] for c in curves])
+        return table
+
+    def uniform(self, step: float) -> "PowerCurveTable":
+        """Lookup table on a uniform grid of spacing step [m/s].
+
+        Evaluation then indexes the grid in O(1) instead of a binary search.
+        Exact when step divides every breakpoint's offset from the first
+        speed (e.g. 0.5 for curves tabulated every 0.5 or 1 m/s); otherwise
+        the curves are approximated to within the grid resolution.
+        """
+        n = int(np.ceil((self.speed[-1] - self.speed[0]) / step)) + 1
+        speed = self.speed[0] + step * np.arange(n)
+        power = np.array([np.interp(speed, self.speed, row) for row in self.power])
+        return PowerCurveTable(speed, power)
+
+    def __len__(self):
+        return self.power.shape[0]
+
+    def evaluate(self, wind_speeds: np.ndarray, models=None) -> np.ndarray:
+        """Power output [kW] for batches of wind speeds.
+
+        Curves that are each evenly spaced (evenly_spaced) are indexed
+        directly; otherwise one np.interp runs over all breakpoints.
+
+        Parameters
+        ----------
+        wind_speeds : np.ndarray
+            Wind speeds, e.g. shape (n_sites, n_samples).
+        models : array of int, optional
+            Model index per value, broadcast against wind_speeds (for one
+            model per site pass shape (n_sites, 1)). If omitted every model
+            is evaluated on every wind speed.
+
+        Returns
+        -------
+        np.ndarray
+            Shape broadcast(wind_speeds, models), or
+            (n_models,) + wind_speeds.shape if models is None.
+        """
+        wind_speeds = np.asarray(wind_speeds, dtype=float)
+        if models is None:
+            models = np.arange(len(self)).reshape((-1,) + (1,) * wind_speeds.ndim)
+        models = np.asarray(models)
+        start = self._start[models]
+        v = np.clip(wind_speeds, start, self._end[models])
+        v -= start
+        if not self.evenly_spaced:
+            v += models * self._span
+            return np.interp(v, self._keys, self._values)
+
+        v *= self._inv_step[models]
+        idx = v.astype(np.intp)
+        np.minimum(idx, self._last[models], out=idx)
+        v -= idx
+        idx += self._base[models]
+        return self._values[idx] + v * self._rise[idx]
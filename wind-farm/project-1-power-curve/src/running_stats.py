@@ -0,0 +1,117 @@
+import numpy as np
+
+
+class QuantileSketch:
+    """Fixed-bin quantile sketch for values in a known range [lo, hi].
+
+    Counts values in n_bins equal bins and answers quantiles by linear
+    interpolation inside the bin, so the error is at most one bin width,
+    (hi - lo) / n_bins, whatever the number of samples. Values outside the
+    range are counted in the end bins. Sketches with the same range and
+    bins merge exactly by adding counts.
+    """
+
+    def __init__(self, lo: float, hi: float, n_bins: int = 65536):
+        self.lo = float(lo)
+        self.hi = float(hi)
+        self.counts = np.zeros(n_bins, dtype=np.int64)
+
+    @property
+    def bin_width(self) -> float:
+        return (self.hi - self.lo) / self.counts.size
+
+    def update(self, values: np.ndarray) -> None:
+        n_bins = self.counts.size
+        idx = ((values - self.lo) / self.bin_width).astype(np.int64)
+        np.clip(idx, 0, n_bins - 1, out=idx)
+        self.counts += np.bincount(idx, minlength=n_bins)
+
+    def merge(self, other: "QuantileSketch") -> None:
+        self.counts += other.counts
+
+    def quantile(self, q):
+        """Approximate q-quantile(s), q in [0, 1]."""
+        q = np.asarray(q, dtype=float)
+        cumulative = np.cumsum(self.counts)
+        rank = q * cumulative[-1]
+        b = np.searchsorted(cumulative, rank, side="left")
+        b = np.minimum(b, self.counts.size - 1)
+        before = np.where(b > 0, cumulative[b - 1], 0)
+        inside = np.where(self.counts[b] > 0, (rank - before) / np.maximum(self.counts[b], 1), 0.0)
+        return self.lo + (b + inside) * self.bin_width
+
+
+class RunningStats:
+    """Constant-memory summary of a stream of samples.
+
+    Mean and variance are accumulated per chunk and combined with Chan's
+    pairwise update, which stays accurate over billions of samples. A
+    histogram with fixed edges and a QuantileSketch over [lo, hi] give
+    the distribution and P50/P90.
+    """
+
+    def __init__(self, lo: float, hi: float, bins: int = 40, sketch_bins: int = 65536):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = np.inf
+        self.max = -np.inf
+        self.edges = np.linspace(lo, hi, bins + 1)
+        self.hist = np.zeros(bins, dtype=np.int64)
+        self.sketch = QuantileSketch(lo, hi, sketch_bins)
+
+    def _combine(self, count: int, mean: float, m2: float) -> None:
+        total = self.count + count
+        delta = mean - self.mean
+        self.mean += delta * count / total
+        self.m2 += m2 + delta * delta * self.count * count / total
+        self.count = total
+
+    def update(self, values: np.ndarray) -> None:
+        """Add one chunk of samples."""
+        if values.size == 0:
+            return
+        mean = float(values.mean())
+        m2 = float(np.sum((values - mean) ** 2))
+        self._combine(values.size, mean, m2)
+        self.min = min(self.min, float(values.min()))
+        self.max = max(self.max, float(values.max()))
+        # Edges span [lo, hi]; clip so out-of-range values land in the end bins
+        self.hist += np.histogram(np.clip(values, self.edges[0], self.edges[-1]), bins=self.edges)[0]
+        self.sketch.update(values)
+
+    def merge(self, other: "RunningStats") -> None:
+        """Fold in the statistics of another stream with the same bins."""
+        if other.count == 0:
+            return
+        self._combine(other.count, other.mean, other.m2)
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self.hist += other.hist
+        self.sketch.merge(other.sketch)
+
+    @property
+    def variance(self) -> float:
+        return self.m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    @property
+    def std(self) -> float:
+        return float(np.sqrt(self.variance))
+
+    def quantile(self, q):
+        return self.sketch.quantile(q)
+
+    def exceedance(self, p: float) -> float:
+        """Value exceeded with probability p/100, e.g. p=90 for P90."""
+        return float(self.quantile(1.0 - p / 100.0))
+
+    def summary(self) -> dict:
+        return {
+            "count": self.count,
+            "mean": self.mean,
+            "std": self.std,
+            "min": self.min,
+            "max": self.max,
+            "P50": self.exceedance(50),
+            "P90": self.exceedance(90),
+        }
@@ -1,5 +1,11 @@
+from concurrent.futures import ProcessPoolExecutor
+
 import numpy as np
 from model import generate_wind_speeds
+from running_stats import RunningStats
+
+# Samples per chunk in streaming mode (~8 MB of float64 per array)
+CHUNK_SIZE = 1_000_000
 
 def load_power_curve() -> dict:
     """Returns a simple turbine power curve.
@@ -16,9 +22,69 @@ def simulate_power_output(wind_speeds: np.ndarray, power_curve: dict) -> np.ndar
     return np.interp(wind_speeds, power_curve["speed"], power_curve["power"])
 
 
-def run_simulation(k: float, c: float, size: int = 10000) -> np.ndarray:
-    """Full simulation pipeline: generate wind speeds, load power curve, compute output."""
-    wind_speeds = generate_wind_speeds(k, c, size)
+def run_simulation(k: float, c: float, size: int = 10000, rng=None) -> np.ndarray:
+    """Full simulation pipeline: generate wind speeds, load power curve, compute output.
+
+    rng is a numpy Generator or seed (see generate_wind_speeds).
+    """
+    wind_speeds = generate_wind_speeds(k, c, size, rng)
     curve = load_power_curve()
     power_output = simulate_power_output(wind_speeds, curve)
-    return power_output
\ No newline at end of file
+    return power_output
+
+
+def run_simulation_streaming(k: float, c: float, size: int = 10000,
+                             chunk_size: int = CHUNK_SIZE, bins: int = 40, rng=None) -> RunningStats:
+    """Streaming version of run_simulation for very large sample counts.
+
+    Wind speeds are generated and converted to power chunk_size samples at
+    a time, and only running statistics are kept (mean, variance,
+    histogram, P50/P90 sketch), so memory does not grow with size.
+    """
+    if rng is not None:
+        rng = np.random.default_rng(rng)
+    curve = load_power_curve()
+    stats = RunningStats(0.0, float(np.max(curve["power"])), bins=bins)
+    for start in range(0, size, chunk_size):
+        wind_speeds = generate_wind_speeds(k, c, min(chunk_size, size - start), rng)
+        stats.update(simulate_power_output(wind_speeds, curve))
+    return stats
+
+
+def _simulate_chunks(k: float, c: float, chunk_sizes: list, seeds: list, bins: int) -> RunningStats:
+    """Worker task: one independent random stream per chunk, merged in order."""
+    curve = load_power_curve()
+    stats = RunningStats(0.0, float(np.max(curve["power"])), bins=bins)
+    for n, seed in zip(chunk_sizes, seeds):
+        wind_speeds = generate_wind_speeds(k, c, n, seed)
+        stats.update(simulate_power_output(wind_speeds, curve))
+    return stats
+
+
+def run_simulation_parallel(k: float, c: float, size: int, seed: int, n_workers: int = 4,
+                            chunk_size: int = CHUNK_SIZE, bins: int = 40) -> RunningStats:
+    """Streaming simulation with chunks generated concurrently in a process pool.
+
+    Every chunk draws from its own child of SeedSequence(seed), so the
+    samples depend only on seed and chunk_size. Each worker handles a
+    contiguous run of chunks and the worker summaries are merged in
+    order, so the statistics are identical for a given seed and
+    n_workers (other worker counts differ only in floating-point
+    rounding of the mean and variance). size=0 returns empty statistics,
+    as run_simulation_streaming does.
+    """
+    chunk_sizes = [min(chunk_size, size - start) for start in range(0, size, chunk_size)]
+    if not chunk_sizes:
+        return RunningStats(0.0, float(np.max(load_power_curve()["power"])), bins=bins)
+    seeds = np.random.SeedSequence(seed).spawn(len(chunk_sizes))
+    bounds = np.linspace(0, len(chunk_sizes), n_workers + 1).astype(int)
+
+    with ProcessPoolExecutor(max_workers=n_workers) as pool:
+        futures = [pool.submit(_simulate_chunks, k, c, chunk_sizes[lo:hi], seeds[lo:hi], bins)
+                   for lo, hi in zip(bounds[:-1], bounds[1:]) if hi > lo]
+        parts = [f.result() for f in futures]
+
+    stats = parts[0]
+    for part in parts[1:]:
+        stats.merge(part)
+    return stats
@@ -0,0 +1,223 @@
+import numpy as np
+from .wake_model import (velocity_deficit_array, in_wake_mask, induction_factor,
+                         turbulence_intensity_increment_array)
+from .wake_index import WakeIndex
+from .turbine import TurbineArray
+
+# Reference wind speed of the simple power model [m/s]
+U_REF = 12.0
+HOURS_PER_YEAR = 8760
+
+class ArrayWindFarm:
+    # Target turbines evaluated per block; bounds the (N, block) pair arrays
+    block_size = 1024
+
+    def __init__(self, x, y, rotor_diameter, thrust_coefficient, rated_power_kw,
+                 U_inf, k, air_density=1.225, spatial_index=False):
+        """
+        Structure-of-arrays wind farm with the physics of WindFarm.
+        All turbine pairs are evaluated with NumPy; results agree with
+        WindFarm to floating-point rounding.
+
+        With spatial_index=True, candidate wake pairs come from a WakeIndex
+        sweep instead of testing all N^2 pairs; results are identical.
+
+        x, y: turbine positions [m]
+        rotor_diameter, thrust_coefficient, rated_power_kw: per-turbine
+            arrays, or scalars shared by all turbines
+        U_inf: free-stream wind speed [m/s]
+        k: wake expansion coefficient
+
+        The inputs are copied, so later changes to the caller's arrays do
+        not reach the farm or its per-direction wake cache.
+        """
+        self.x = np.array(x, dtype=float)
+        self.y = np.array(y, dtype=float)
+        n = self.x.size
+        self.D = np.broadcast_to(np.array(rotor_diameter, dtype=float), (n,))
+        self.R = self.D / 2.0
+        self.C_T = np.broadcast_to(np.array(thrust_coefficient, dtype=float), (n,))
+        self.rated_power_kw = np.broadcast_to(np.array(rated_power_kw, dtype=float), (n,))
+        self.U_inf = U_inf
+        self.k = k
+        self.air_density = air_density
+        self.spatial_index = spatial_index
+        # Combined fractional wake deficit per turbine, by wind direction
+        self._direction_cache = {}
+
+    @classmethod
+    def from_turbines(cls, turbines, U_inf, k, air_density=1.225, spatial_index=False):
+        """Build from a list of Turbine objects or a TurbineArray."""
+        if isinstance(turbines, TurbineArray):
+            return cls(turbines.x, turbines.y, turbines.D, turbines.C_T,
+                       turbines.rated_power_kw, U_inf, k, air_density, spatial_index)
+        return cls([t.x for t in turbines],
+                   [t.y for t in turbines],
+                   [t.D for t in turbines],
+                   [t.C_T for t in turbines],
+                   [t.rated_power_kw for t in turbines],
+                   U_inf, k, air_density, spatial_index)
+
+    def __len__(self):
+        return self.x.size
+
+    def _blocks(self):
+        for start in range(0, len(self), self.block_size):
+            yield slice(start, min(start + self.block_size, len(self)))
+
+    def _make_index(self, x, y):
+        return WakeIndex(x, y, self.R, self.k) if self.spatial_index else None
+
+    def _wake_pairs(self, x, y, targets, index=None):
+        """
+        In-wake (source, target) pairs for turbines at x, y with wind along
+        +x, and the fractional deficit dU / U_inf of each pair. Target
+        indices are relative to the targets slice.
+
+        Without an index every source is tested against every target;
+        a WakeIndex built for the same x, y limits the tests to its
+        candidates. Either way pairs come sorted by source within each
+        target, so the RSS sums add terms in the same order.
+        """
+        x_t = x[targets]
+        y_t = y[targets]
+        if index is None:
+            in_wake = in_wake_mask(x_t[None, :], y_t[None, :],
+                                   x[:, None], y[:, None], self.R[:, None], self.k)
+            src, tgt = np.nonzero(in_wake)
+        else:
+            src, tgt = index.candidate_pairs(x_t, y_t)
+            in_wake = in_wake_mask(x_t[tgt], y_t[tgt], x[src], y[src], self.R[src], self.k)
+            src, tgt = src[in_wake], tgt[in_wake]
+            order = np.argsort(tgt.astype(np.int64) * x.size + src)
+            src, tgt = src[order], tgt[order]
+        dx = x_t[tgt] - x[src]
+        fraction = velocity_deficit_array(dx, self.U_inf, self.C_T[src], self.R[src], self.k)
+        return src, tgt, fraction
+
+    def pairwise_deficits(self, targets=slice(None)):
+        """
+        Velocity deficits dU [m/s] of every source turbine (rows) on the
+        target turbines (columns); zero where the target is not in the
+        source's wake. Deficits are only evaluated for in-wake pairs.
+        """
+        index = self._make_index(self.x, self.y)
+        src, tgt, fraction = self._wake_pairs(self.x, self.y, targets, index)
+        dU = np.zeros((len(self), self.x[targets].size))
+        dU[src, tgt] = fraction * self.U_inf
+        return dU
+
+    def _wake_sums(self, turbulence=False):
+        """
+        Per block of targets, the sums over in-wake sources of squared
+        velocity deficits dU^2 and, if turbulence, of squared TI
+        increments. Both come from the same pair search.
+        """
+        index = self._make_index(self.x, self.y)
+        for block in self._blocks():
+            src, tgt, fraction = self._wake_pairs(self.x, self.y, block, index)
+            n_block = block.stop - block.start
+            dU = fraction * self.U_inf
+            # bincount adds each target's sources in turbine order, like WindFarm
+            sum_dU2 = np.bincount(tgt, dU * dU, minlength=n_block)
+            sum_dTI2 = None
+            if turbulence:
+                dx = self.x[block][tgt] - self.x[src]
+                dTI = turbulence_intensity_increment_array(dx, self.D[src],
+                                                           induction_factor(self.C_T[src]))
+                sum_dTI2 = np.bincount(tgt, dTI * dTI, minlength=n_block)
+            yield block, sum_dU2, sum_dTI2
+
+    def effective_wind_speeds(self):
+        """
+        Effective wind speed at every turbine, combining the deficits of
+        all upstream turbines whose wake covers it by root-sum-square.
+        """
+        U_eff = np.empty(len(self))
+        for block, sum_dU2, _ in self._wake_sums():
+            U_eff[block] = np.maximum(self.U_inf - np.sqrt(sum_dU2), 0.0)
+        return U_eff
+
+    def wake_conditions(self, ambient_ti):
+        """
+        Effective wind speed and turbulence intensity at every turbine.
+        TI is the root-sum-square of ambient_ti and the increments of all
+        upstream turbines whose wake covers the turbine.
+        """
+        U_eff = np.empty(len(self))
+        TI = np.empty(len(self))
+        for block, sum_dU2, sum_dTI2 in self._wake_sums(turbulence=True):
+            U_eff[block] = np.maximum(self.U_inf - np.sqrt(sum_dU2), 0.0)
+            TI[block] = np.sqrt(ambient_ti ** 2 + sum_dTI2)
+        return U_eff, TI
+
+    def turbulence_intensities(self, ambient_ti):
+        return self.wake_conditions(ambient_ti)[1]
+
+    def turbine_powers(self, U_eff=None):
+        """Power per turbine [kW]: P ~ U^3, capped at rated power."""
+        if U_eff is None:
+            U_eff = self.effective_wind_speeds()
+        P = self.rated_power_kw * (U_eff / U_REF) ** 3
+        return np.where(U_eff > 0, np.minimum(P, self.rated_power_kw), 0.0)
+
+    def farm_power(self):
+        # Sequential sum, in turbine order like WindFarm.farm_power
+        return sum(self.turbine_powers().tolist())
+
+    # --- WIND ROSE ---------------------------------------------------------
+
+    def rotated_positions(self, direction_deg):
+        """
+        Turbine positions rotated counterclockwise by direction_deg, the
+        frame in which that wind direction blows along +x.
+        """
+        theta = np.radians(direction_deg)
+        xr = self.x * np.cos(theta) - self.y * np.sin(theta)
+        yr = self.x * np.sin(theta) + self.y * np.cos(theta)
+        return xr, yr
+
+    def direction_deficits(self, direction_deg):
+        """
+        Root-sum-square of the fractional velocity deficits (dU / U_inf)
+        at every turbine for one wind direction.
+
+        Jensen deficits scale with U_inf, so this fixes the wake losses
+        for all wind speeds of the direction. The pair search in the
+        rotated frame is the expensive part and is cached per direction.
+        """
+        key = float(direction_deg) % 360.0
+        if key not in self._direction_cache:
+            xr, yr = self.rotated_positions(key)
+            index = self._make_index(xr, yr)
+            rss = np.empty(len(self))
+            for block in self._blocks():
+                src, tgt, fraction = self._wake_pairs(xr, yr, block, index)
+                n_block = block.stop - block.start
+                rss[block] = np.sqrt(np.bincount(tgt, fraction * fraction, minlength=n_block))
+            self._direction_cache[key] = rss
+        return self._direction_cache[key]
+
+    def power_rose(self, directions_deg, speeds):
+        """
+        Farm power [kW] for every (direction, free-stream speed) bin,
+        shape (len(directions_deg), len(speeds)). All speeds of a
+        direction are evaluated in one broadcast pass.
+        """
+        speeds = np.asarray(speeds, dtype=float)
+        power = np.empty((len(directions_deg), speeds.size))
+        for i, direction in enumerate(directions_deg):
+            rss = self.direction_deficits(direction)
+            U_eff = np.maximum(speeds[:, None] * (1.0 - rss[None, :]), 0.0)
+            power[i] = self.turbine_powers(U_eff).sum(axis=1)
+        return power
+
+    def aep(self, directions_deg, speeds, frequencies, hours=HOURS_PER_YEAR):
+        """
+        Annual energy production [kWh] over a wind rose.
+
+        frequencies[i, j] is the probability of wind from directions_deg[i]
+        at speeds[j]; the table should sum to 1.
+        """
+        frequencies = np.asarray(frequencies, dtype=float)
+        return hours * float(np.sum(frequencies * self.power_rose(directions_deg, speeds)))
@@ -0,0 +1,240 @@
+"""
+Timing benchmarks for the wind farm models.
+
+Run from the project root:  python -m src.benchmarks
+"""
+import time
+import tracemalloc
+import numpy as np
+
+from .turbine import Turbine, TurbineArray
+from .farm import WindFarm
+from .array_farm import ArrayWindFarm
+from .incremental import IncrementalWindFarm
+
+# Turbine used throughout (data/turbine_specs.json)
+D = 120
+C_T = 0.8
+P_RATED = 3000
+U_INF = 8.0
+K = 0.04
+TI_AMBIENT = 0.08
+
+def _best_time(func, *args, repeat=3):
+    best = np.inf
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def offshore_farm(n_turbines, spacing=5 * D, jitter=0.5 * D, seed=0):
+    """Square grid of n_turbines with jittered positions, as a list of Turbine."""
+    rng = np.random.default_rng(seed)
+    side = int(np.ceil(np.sqrt(n_turbines)))
+    idx = np.arange(n_turbines)
+    xs = (idx % side) * spacing + rng.normal(0, jitter, n_turbines)
+    ys = (idx // side) * spacing + rng.normal(0, jitter, n_turbines)
+    return [Turbine(float(x), float(y), D, C_T, P_RATED) for x, y in zip(xs, ys)]
+
+def bench_array_farm(sizes=(100, 500, 1000, 2000)):
+    """WindFarm (per-turbine Python loops) vs ArrayWindFarm on farm power."""
+    print("Farm power: WindFarm vs ArrayWindFarm")
+    print(f"{'turbines':>9} {'WindFarm [s]':>13} {'array [s]':>10} {'speedup':>9} {'max |dP| [kW]':>14}")
+
+    for n in sizes:
+        farm = WindFarm(offshore_farm(n), U_INF, K)
+        array_farm = farm.as_array()
+
+        t_loop = _best_time(farm.farm_power, repeat=1)
+        t_array = _best_time(array_farm.farm_power)
+
+        P_loop = np.array([farm.power_at(i) for i in range(n)])
+        dP = np.abs(P_loop - array_farm.turbine_powers()).max()
+        assert np.allclose(P_loop, array_farm.turbine_powers(), rtol=1e-12, atol=0)
+        print(f"{n:>9} {t_loop:>13.4f} {t_array:>10.4f} {t_loop / t_array:>8.1f}x {dP:>14.2e}")
+
+def bench_wind_rose(n_turbines=500, n_directions=36, n_speeds=25):
+    """
+    AEP over a wind rose: one ArrayWindFarm evaluation per (direction,
+    speed) bin vs the batched power_rose, cold and with the direction
+    cache filled.
+    """
+    farm = WindFarm(offshore_farm(n_turbines), U_INF, K).as_array()
+    directions = np.arange(n_directions) * 360.0 / n_directions
+    speeds = np.linspace(3.0, 25.0, n_speeds)
+    frequencies = np.full((n_directions, n_speeds), 1.0 / (n_directions * n_speeds))
+
+    def per_bin():
+        power = np.empty((n_directions, n_speeds))
+        for i, direction in enumerate(directions):
+            xr, yr = farm.rotated_positions(direction)
+            for j, U in enumerate(speeds):
+                power[i, j] = ArrayWindFarm(xr, yr, farm.D, farm.C_T, farm.rated_power_kw, U, K).farm_power()
+        return power
+
+    start = time.perf_counter()
+    reference = per_bin()
+    t_bins = time.perf_counter() - start
+
+    start = time.perf_counter()
+    rose = farm.power_rose(directions, speeds)
+    t_cold = time.perf_counter() - start
+    t_warm = _best_time(farm.aep, directions, speeds, frequencies)
+
+    assert np.allclose(rose, reference, rtol=1e-12)
+    print(f"Wind-rose AEP: {n_directions} directions x {n_speeds} speeds, {n_turbines} turbines")
+    print(f"  per-bin evaluation   {t_bins:8.3f} s")
+    print(f"  batched, cold cache  {t_cold:8.3f} s  ({t_bins / t_cold:.0f}x)")
+    print(f"  batched, warm cache  {t_warm:8.4f} s  ({t_bins / t_warm:.0f}x)")
+    print(f"  AEP = {farm.aep(directions, speeds, frequencies) / 1e6:.1f} GWh")
+
+def bench_spatial_index(sizes=(100, 1000, 10000)):
+    """
+    ArrayWindFarm effective wind speeds with all-pairs wake tests vs the
+    WakeIndex sorted sweep, plus WindFarm (Python loops) at the small size.
+    """
+    print("Effective wind speeds: all pairs vs spatial index")
+    print(f"{'turbines':>9} {'all pairs [s]':>14} {'indexed [s]':>12} {'speedup':>9}")
+
+    for n in sizes:
+        turbines = offshore_farm(n)
+        brute = ArrayWindFarm.from_turbines(turbines, U_INF, K)
+        indexed = ArrayWindFarm.from_turbines(turbines, U_INF, K, spatial_index=True)
+
+        t_brute = _best_time(brute.effective_wind_speeds)
+        t_indexed = _best_time(indexed.effective_wind_speeds)
+        assert np.array_equal(brute.effective_wind_speeds(), indexed.effective_wind_speeds())
+        print(f"{n:>9} {t_brute:>14.4f} {t_indexed:>12.4f} {t_brute / t_indexed:>8.1f}x")
+
+    n = sizes[0]
+    loop = WindFarm(offshore_farm(n), U_INF, K)
+    loop_indexed = WindFarm(offshore_farm(n), U_INF, K, spatial_index=True)
+    t_loop = _best_time(loop.farm_power)
+    t_loop_indexed = _best_time(loop_indexed.farm_power)
+    assert loop.farm_power() == loop_indexed.farm_power()
+    print(f"  WindFarm, {n} turbines: {t_loop:.4f} s scan, {t_loop_indexed:.4f} s indexed")
+
+def bench_incremental(sizes=(100, 500, 2000), n_moves=200, seed=1):
+    """
+    Random single-turbine moves, re-evaluating farm power after each:
+    full ArrayWindFarm evaluation vs IncrementalWindFarm.move.
+    """
+    print("Single-turbine moves: full re-evaluation vs incremental")
+    print(f"{'turbines':>9} {'full [ms/move]':>15} {'incremental [ms/move]':>22} {'speedup':>9} {'rel. error':>11}")
+
+    for n in sizes:
+        farm = WindFarm(offshore_farm(n), U_INF, K).as_array()
+        rng = np.random.default_rng(seed)
+        moves = [(int(rng.integers(n)), *rng.normal(0, 2 * D, 2)) for _ in range(n_moves)]
+
+        def full():
+            x, y = farm.x.copy(), farm.y.copy()
+            for i, dx, dy in moves:
+                x[i] += dx
+                y[i] += dy
+                power = ArrayWindFarm(x, y, D, C_T, P_RATED, U_INF, K).farm_power()
+            return power
+
+        def incremental():
+            inc = IncrementalWindFarm(farm)
+            start = time.perf_counter()
+            for i, dx, dy in moves:
+                power = inc.move(i, inc.farm.x[i] + dx, inc.farm.y[i] + dy)
+            return power, time.perf_counter() - start
+
+        start = time.perf_counter()
+        reference = full()
+        t_full = time.perf_counter() - start
+        power, t_inc = incremental()
+
+        error = abs(power - reference) / reference
+        assert error < 1e-9
+        print(f"{n:>9} {1e3 * t_full / n_moves:>15.3f} {1e3 * t_inc / n_moves:>22.3f} "
+              f"{t_full / t_inc:>8.0f}x {error:>11.1e}")
+
+def bench_turbulence(sizes=(100, 1000, 5000)):
+    """
+    Extra cost of the turbulence-intensity stage: effective wind speeds
+    alone vs wind speeds and TI from the same pair search.
+    """
+    print("Wake pass: wind speeds only vs wind speeds + turbulence intensity")
+    print(f"{'turbines':>9} {'speeds [s]':>11} {'speeds + TI [s]':>16} {'overhead':>9}")
+
+    for n in sizes:
+        farm = WindFarm(offshore_farm(n), U_INF, K)
+        array_farm = farm.as_array()
+        if n <= 1000:
+            TI_loop = [farm.turbulence_intensity_at(i, TI_AMBIENT) for i in range(n)]
+            assert np.allclose(TI_loop, array_farm.turbulence_intensities(TI_AMBIENT), rtol=1e-12)
+
+        t_speeds = _best_time(array_farm.effective_wind_speeds)
+        t_both = _best_time(array_farm.wake_conditions, TI_AMBIENT)
+        print(f"{n:>9} {t_speeds:>11.4f} {t_both:>16.4f} {100 * (t_both / t_speeds - 1):>8.0f}%")
+
+class _DictTurbine:
+    # Turbine as it was before __slots__, for comparison
+    def __init__(self, x, y, rotor_diameter, thrust_coefficient, rated_power_kw):
+        self.x = x
+        self.y = y
+        self.D = rotor_diameter
+        self.R = rotor_diameter / 2.0
+        self.C_T = thrust_coefficient
+        self.rated_power_kw = rated_power_kw
+
+def _allocation(build):
+    """Build the object; returns (object, seconds, bytes allocated)."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    obj = build()
+    elapsed = time.perf_counter() - start
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return obj, elapsed, size
+
+def bench_turbine_storage(n_turbines=50_000, n_scalar=500):
+    """
+    Memory per turbine and construction time of a regional study:
+    list of dict-backed turbines, list of __slots__ Turbine, TurbineArray.
+    Construction times include tracemalloc overhead.
+    """
+    rng = np.random.default_rng(0)
+    xs = rng.uniform(0, 1e6, n_turbines).tolist()
+    ys = rng.uniform(0, 1e6, n_turbines).tolist()
+
+    builds = {
+        "list of dict Turbine": lambda: [_DictTurbine(x, y, D, C_T, P_RATED) for x, y in zip(xs, ys)],
+        "list of slots Turbine": lambda: [Turbine(x, y, D, C_T, P_RATED) for x, y in zip(xs, ys)],
+        "TurbineArray": lambda: TurbineArray.from_arrays(xs, ys, D, C_T, P_RATED),
+    }
+    print(f"Turbine storage, {n_turbines} turbines")
+    print(f"{'':>22} {'bytes/turbine':>14} {'build [ms]':>11}")
+    for name, build in builds.items():
+        _, elapsed, size = _allocation(build)
+        print(f"{name:>22} {size / n_turbines:>14.0f} {1e3 * elapsed:>11.1f}")
+
+    turbines = TurbineArray.from_arrays(xs, ys, D, C_T, P_RATED)
+    as_list = turbines.to_turbines()
+    assert np.array_equal(TurbineArray.from_turbines(as_list).records, turbines.records)
+    t_list = _best_time(lambda: WindFarm(as_list, U_INF, K).as_array())
+    t_records = _best_time(lambda: WindFarm(turbines, U_INF, K).as_array())
+    print(f"  WindFarm.as_array(): {1e3 * t_list:.1f} ms from list, {1e3 * t_records:.2f} ms from TurbineArray")
+
+    # Scalar per-turbine path on a smaller, jittered 5D grid farm
+    gx, gy = np.divmod(np.arange(n_scalar), 20)
+    small = TurbineArray.from_arrays(5 * D * gx + rng.uniform(-D, D, n_scalar),
+                                     5 * D * gy + rng.uniform(-D, D, n_scalar), D, C_T, P_RATED)
+    small_list = small.to_turbines()
+    assert WindFarm(small, U_INF, K).farm_power() == WindFarm(small_list, U_INF, K).farm_power()
+    t_list = _best_time(lambda: WindFarm(small_list, U_INF, K).farm_power())
+    t_records = _best_time(lambda: WindFarm(small, U_INF, K).farm_power())
+    print(f"  WindFarm.farm_power(), {n_scalar} turbines: {1e3 * t_list:.1f} ms from list, "
+          f"{1e3 * t_records:.1f} ms from TurbineArray")
+
+if __name__ == "__main__":
+    bench_array_farm()
+    bench_wind_rose()
+    bench_spatial_index()
+    bench_incremental()
+    bench_turbulence()
+    bench_turbine_storage()
@@ -1,26 +1,71 @@
 import math
-from .turbine import Turbine
-from .wake_model import velocity_deficit, is_in_wake
+import numpy as np
+from .turbine import Turbine, TurbineArray
+from .wake_model import (velocity_deficit, is_in_wake, in_wake_mask, induction_factor,
+                         turbulence_intensity_increment, combined_turbulence_intensity)
+from .array_farm import ArrayWindFarm
+from .wake_index import WakeIndex
+from .incremental import IncrementalWindFarm
 
 class WindFarm:
-    def __init__(self, turbines, U_inf, k, air_density=1.225):
+    def __init__(self, turbines, U_inf, k, air_density=1.225, spatial_index=False):
         """
-        turbines: list of Turbine objects
+        turbines: list of Turbine objects, or a TurbineArray (the
+            vectorized paths read its fields without building Turbines)
         U_inf: free-stream wind speed [m/s]
         k: wake expansion coefficient
+        spatial_index: look up upstream turbines through a WakeIndex
+            instead of scanning the whole farm (same results). The index
+            is built from the positions at first use. farm_power()
+            rebuilds it if turbines have moved; before calling the
+            per-turbine methods (power_at, effective_wind_speed_at,
+            turbulence_intensity_at) after a move, call reset_index().
         """
         self.turbines = turbines
         self.U_inf = U_inf
         self.k = k
         self.air_density = air_density
+        self.spatial_index = spatial_index
+        self._index = None
+
+    def _positions(self):
+        turbines = self.turbines
+        if not isinstance(turbines, TurbineArray):
+            turbines = TurbineArray.from_turbines(turbines)
+        return turbines.x, turbines.y, turbines.R
+
+    def _wake_index(self):
+        # Built on first use from a snapshot of the positions
+        if self._index is None:
+            self._index = WakeIndex(*self._positions(), self.k)
+        return self._index
+
+    def reset_index(self):
+        """Drop the spatial index so it is rebuilt from the current positions."""
+        self._index = None
 
     def _upstream_turbines(self, idx):
         """
         Return turbines that are upstream of turbine idx
         (wind from left to right: smaller x is upstream).
+        With the spatial index only those whose wake can reach it.
+        For a TurbineArray the wake test runs on its field arrays (over
+        the index candidates with the spatial index), and Turbine objects
+        are built from the current records only for the hits.
         """
-        x_target = self.turbines[idx].x
-        return [t for t in self.turbines if t.x < x_target]
+        target = self.turbines[idx]
+        if self.spatial_index:
+            candidates = self._wake_index().candidates(target.x, target.y)
+        if isinstance(self.turbines, TurbineArray):
+            t = self.turbines
+            if not self.spatial_index:
+                candidates = np.arange(len(t))
+            in_wake = in_wake_mask(target.x, target.y, t.x[candidates], t.y[candidates],
+                                   t.R[candidates], self.k)
+            return [t[j] for j in candidates[in_wake]]
+        if self.spatial_index:
+            return [self.turbines[j] for j in candidates]
+        return [t for t in self.turbines if t.x < target.x]
 
     def effective_wind_speed_at(self, idx):
         """
@@ -45,6 +90,22 @@ class WindFarm:
         U_eff = max(U_inf - total_deficit, 0.0)
         return U_eff
 
+    def turbulence_intensity_at(self, idx, ambient_ti):
+        """
+        Turbulence intensity at turbine idx: ambient TI combined by
+        root-sum-square with the increments of the turbines waking it.
+        """
+        target = self.turbines[idx]
+        increments = []
+
+        for up in self._upstream_turbines(idx):
+            if is_in_wake(target.x, target.y, up.x, up.y, up.R, self.k):
+                dx = target.x - up.x
+                increments.append(turbulence_intensity_increment(
+                    dx, up.D, induction_factor(up.C_T)))
+
+        return combined_turbulence_intensity(ambient_ti, increments)
+
     def power_at(self, idx):
         """
         Very simple power model: P ~ U^3, capped at rated power.
@@ -61,4 +122,33 @@ class WindFarm:
         return min(P, t.rated_power_kw)
 
     def farm_power(self):
+        if self._index is not None and not self._index.matches(*self._positions()):
+            self.reset_index()
         return sum(self.power_at(i) for i in range(len(self.turbines)))
+
+    def as_array(self):
+        """Array-backed copy of this farm for vectorized evaluation."""
+        return ArrayWindFarm.from_turbines(self.turbines, self.U_inf, self.k,
+                                           self.air_density, self.spatial_index)
+
+    def turbulence_intensities(self, ambient_ti):
+        """
+        Turbulence intensity at every turbine, evaluated in the same
+        vectorized pass as the wake deficits (ArrayWindFarm.wake_conditions).
+        """
+        return self.as_array().turbulence_intensities(ambient_ti)
+
+    def incremental(self):
+        """
+        Evaluator that updates farm power in O(N) per single-turbine
+        move; see IncrementalWindFarm.
+        """
+        return IncrementalWindFarm(self.as_array())
+
+    def aep(self, directions_deg, speeds, frequencies):
+        """
+        Annual energy production [kWh] over a wind rose; see
+        ArrayWindFarm.aep. Keep the result of as_array() to reuse its
+        per-direction wake cache across calls.
+        """
+        return self.as_array().aep(directions_deg, speeds, frequencies)
@@ -0,0 +1,74 @@
+import numpy as np
+from .array_farm import ArrayWindFarm
+from .wake_model import velocity_deficit_array, in_wake_mask
+
+class IncrementalWindFarm:
+    def __init__(self, farm):
+        """
+        Farm power under single-turbine moves, for local search and
+        simulated annealing.
+
+        Keeps the (source, target) matrix of squared velocity deficits and
+        the per-target sums of its columns. Moving turbine i only changes
+        row i (its wake on the others) and column i (their wakes on it),
+        so a move costs O(N) instead of re-evaluating all N^2 pairs.
+        The matrix takes 8 N^2 bytes.
+
+        farm: ArrayWindFarm; its positions are copied, not modified.
+        """
+        self.farm = ArrayWindFarm(farm.x.copy(), farm.y.copy(), farm.D, farm.C_T,
+                                  farm.rated_power_kw, farm.U_inf, farm.k, farm.air_density)
+        dU = self.farm.pairwise_deficits()
+        self.dU2 = dU * dU
+        self.refresh()
+
+    def __len__(self):
+        return len(self.farm)
+
+    def refresh(self):
+        """Re-sum the RSS totals from the matrix, dropping accumulated rounding."""
+        self.sum_sq = self.dU2.sum(axis=0)
+
+    def _source_row(self, i):
+        # Squared deficits of turbine i on every turbine
+        f = self.farm
+        dx = f.x - f.x[i]
+        in_wake = in_wake_mask(f.x, f.y, f.x[i], f.y[i], f.R[i], f.k)
+        dU = velocity_deficit_array(dx, f.U_inf, f.C_T[i], f.R[i], f.k) * f.U_inf
+        return np.where(in_wake, dU * dU, 0.0)
+
+    def _target_column(self, i):
+        # Squared deficits of every turbine on turbine i
+        f = self.farm
+        dx = f.x[i] - f.x
+        in_wake = in_wake_mask(f.x[i], f.y[i], f.x, f.y, f.R, f.k)
+        dU = velocity_deficit_array(dx, f.U_inf, f.C_T, f.R, f.k) * f.U_inf
+        return np.where(in_wake, dU * dU, 0.0)
+
+    def move(self, i, x, y):
+        """Move turbine i to (x, y) and return the new farm power [kW]."""
+        self.farm.x[i] = x
+        self.farm.y[i] = y
+
+        new_row = self._source_row(i)
+        self.sum_sq += new_row - self.dU2[i]
+        self.dU2[i] = new_row
+
+        new_col = self._target_column(i)
+        self.dU2[:, i] = new_col
+        self.sum_sq[i] = new_col.sum()
+        return self.farm_power()
+
+    def effective_wind_speeds(self):
+        # Incremental updates can leave tiny negative sums where all wakes left
+        total_deficit = np.sqrt(np.maximum(self.sum_sq, 0.0))
+        return np.maximum(self.farm.U_inf - total_deficit, 0.0)
+
+    def turbine_powers(self):
+        return self.farm.turbine_powers(self.effective_wind_speeds())
+
+    def farm_power(self):
+        return float(self.turbine_powers().sum())
+
+    def positions(self):
+        return self.farm.x.copy(), self.farm.y.copy()
@@ -1,4 +1,18 @@
+import numpy as np
+
+# Record layout of one turbine in a TurbineArray
+TURBINE_DTYPE = np.dtype([
+    ("x", np.float64),
+    ("y", np.float64),
+    ("D", np.float64),
+    ("C_T", np.float64),
+    ("rated_power_kw", np.float64),
+])
+
 class Turbine:
+    # No per-instance __dict__: less memory and faster attribute access
+    __slots__ = ("x", "y", "D", "R", "C_T", "rated_power_kw")
+
     def __init__(self, x, y, rotor_diameter, thrust_coefficient, rated_power_kw):
         self.x = x
         self.y = y
@@ -9,3 +23,71 @@ class Turbine:
 
     def position(self):
         return (self.x, self.y)
+
+class TurbineArray:
+    def __init__(self, records):
+        """
+        Turbines stored as one NumPy structured array (TURBINE_DTYPE),
+        40 bytes per turbine. Fields are exposed as array views; indexing
+        with an integer returns a Turbine, so WindFarm accepts a
+        TurbineArray wherever it takes a list of Turbine.
+        """
+        self.records = np.asarray(records, dtype=TURBINE_DTYPE)
+
+    @classmethod
+    def from_arrays(cls, x, y, rotor_diameter, thrust_coefficient, rated_power_kw):
+        """Build from per-turbine arrays; scalars are shared by all turbines."""
+        x = np.asarray(x, dtype=float)
+        records = np.empty(x.size, dtype=TURBINE_DTYPE)
+        records["x"] = x
+        records["y"] = y
+        records["D"] = rotor_diameter
+        records["C_T"] = thrust_coefficient
+        records["rated_power_kw"] = rated_power_kw
+        return cls(records)
+
+    @classmethod
+    def from_turbines(cls, turbines):
+        """Build from a list of Turbine objects."""
+        records = np.array([(t.x, t.y, t.D, t.C_T, t.rated_power_kw) for t in turbines],
+                           dtype=TURBINE_DTYPE)
+        return cls(records)
+
+    def to_turbines(self):
+        return [Turbine(*row) for row in self.records.tolist()]
+
+    def __len__(self):
+        return self.records.size
+
+    def __getitem__(self, idx):
+        if isinstance(idx, (int, np.integer)):
+            x, y, D, C_T, rated_power_kw = self.records[idx].tolist()
+            return Turbine(x, y, D, C_T, rated_power_kw)
+        return TurbineArray(self.records[idx])
+
+    def __iter__(self):
+        return iter(self.to_turbines())
+
+    @property
+    def x(self):
+        return self.records["x"]
+
+    @property
+    def y(self):
+        return self.records["y"]
+
+    @property
+    def D(self):
+        return self.records["D"]
+
+    @property
+    def R(self):
+        return self.records["D"] / 2.0
+
+    @property
+    def C_T(self):
+        return self.records["C_T"]
+
+    @property
+    def rated_power_kw(self):
+        return self.records["rated_power_kw"]
@@ -0,0 +1,55 @@
+import numpy as np
+
+class WakeIndex:
+    def __init__(self, x, y, R, k):
+        """
+        Sorted-sweep index over the cross-wind coordinate y (wind along +x).
+
+        A source at x_s < x_t can only reach a target at distance
+        |dy| <= R_s + k (x_t - x_s) <= R_max + k (x_t - x_min), so each
+        target only needs the sources in that y window, found by binary
+        search in the y-sorted order. Candidates still have to pass the
+        exact is_in_wake test. Positions are copied, so later moves do
+        not alter the index (see matches).
+        """
+        self.x = np.array(x, dtype=float)
+        self.y = np.array(y, dtype=float)
+        self.k = k
+        self.R_max = float(np.max(R))
+        self.x_min = float(self.x.min())
+        self.order = np.argsort(self.y, kind="stable")
+        self.y_sorted = self.y[self.order]
+
+    def matches(self, x, y, R):
+        """True if the index is still valid for turbines at (x, y) with radii R."""
+        return (np.array_equal(self.x, x) and np.array_equal(self.y, y)
+                and float(np.max(R)) <= self.R_max)
+
+    def _windows(self, x_t, y_t):
+        half_width = self.R_max + self.k * (x_t - self.x_min)
+        lo = np.searchsorted(self.y_sorted, y_t - half_width, side="left")
+        hi = np.searchsorted(self.y_sorted, y_t + half_width, side="right")
+        return lo, hi
+
+    def candidates(self, x_t, y_t):
+        """Indices (ascending) of the upstream turbines whose wake may reach (x_t, y_t)."""
+        lo, hi = self._windows(x_t, y_t)
+        src = np.sort(self.order[lo:hi])
+        return src[self.x[src] < x_t]
+
+    def candidate_pairs(self, x_t, y_t):
+        """
+        (source, target) index pairs for arrays of target positions;
+        target indices refer to positions in x_t / y_t.
+        """
+        x_t = np.asarray(x_t, dtype=float)
+        y_t = np.asarray(y_t, dtype=float)
+        lo, hi = self._windows(x_t, y_t)
+        counts = hi - lo
+
+        tgt = np.repeat(np.arange(x_t.size), counts)
+        offset = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+        src = self.order[np.repeat(lo, counts) + offset]
+
+        upstream = self.x[src] < x_t[tgt]
+        return src[upstream], tgt[upstream]
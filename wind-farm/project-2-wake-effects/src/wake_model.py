@@ -1,4 +1,6 @@
 import math
+import warnings
+import numpy as np
 
 def wake_radius(x, r0, k):
     """
@@ -33,11 +35,57 @@ def is_in_wake(x_turb, y_turb, x_up, y_up, r0, k):
     r = wake_radius(dx, r0, k)
     return abs(dy) <= r
 
-def turbulence_intensity_increment(x, D, a, TI0):
+def induction_factor(C_T):
     """
-    Simple turbulence intensity model.
-    TI = TI0 + 0.73 a / (1 + 0.83 x / D)^2
+    Induction factor used with the turbulence model,
+    a = 1 - sqrt(1 - C_T), as in notebooks/turbulence.ipynb.
     """
+    return 1 - np.sqrt(1 - C_T)
+
+def turbulence_intensity_increment(x, D, a, TI0=None):
+    """
+    Wake-added turbulence intensity at distance x behind a rotor,
+    dTI = 0.73 a / (1 + 0.83 x / D)^2.
+    Combine with the ambient value by root-sum-square
+    (see combined_turbulence_intensity). TI0 is unused and deprecated;
+    for arrays use turbulence_intensity_increment_array.
+    """
+    if TI0 is not None:
+        warnings.warn("TI0 is unused by turbulence_intensity_increment and will be removed",
+                      DeprecationWarning, stacklevel=2)
     if x <= 0:
         return 0.0
     return 0.73 * a / (1 + 0.83 * x / D) ** 2
+
+def velocity_deficit_array(x, U_inf, C_T, r0, k):
+    """
+    Vectorized velocity_deficit over arrays of x, C_T and r0.
+    Zero wherever x <= 0.
+    """
+    x = np.asarray(x, dtype=float)
+    denom = (1 + (k * np.maximum(x, 0.0) / r0)) ** 2
+    return np.where(x > 0, (1 - np.sqrt(1 - C_T)) / denom, 0.0)
+
+def in_wake_mask(x_turb, y_turb, x_up, y_up, r0, k):
+    """
+    Vectorized is_in_wake: True where (x_turb, y_turb) lies inside the
+    wake of the upstream turbine at (x_up, y_up). Arguments broadcast.
+    """
+    dx = x_turb - x_up
+    dy = y_turb - y_up
+    return (dx > 0) & (np.abs(dy) <= wake_radius(dx, r0, k))
+
+def turbulence_intensity_increment_array(x, D, a):
+    """
+    Vectorized turbulence_intensity_increment over arrays of x, D and a.
+    Zero wherever x <= 0.
+    """
+    x = np.asarray(x, dtype=float)
+    return np.where(x > 0, 0.73 * a / (1 + 0.83 * np.maximum(x, 0.0) / D) ** 2, 0.0)
+
+def combined_turbulence_intensity(TI0, increments):
+    """
+    Turbulence intensity at a turbine: root-sum-square of the ambient TI0
+    and the wake-added increments of all upstream turbines.
+    """
+    return math.sqrt(TI0 ** 2 + sum(dTI ** 2 for dTI in increments))
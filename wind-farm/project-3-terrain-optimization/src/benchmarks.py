@@ -0,0 +1,176 @@
+"""
+Timing benchmarks for the terrain layout optimizer.
+
+Run from src/:  python benchmarks.py
+"""
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import numpy as np
+
+import optimizer
+import terrain_data
+from terrain import generate_terrain
+from wind_shear import compute_wind_field
+from wake_model import jensen_wake, jensen_wake_points, jensen_wake_reference
+
+HOURS_PER_YEAR = 8760
+
+
+def _best_time(func, *args, repeat=3):
+    best = np.inf
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _random_turbines(grid_size, n_turbines, rng):
+    xy = rng.integers(0, grid_size, size=(n_turbines, 2))
+    return [(int(x), int(y)) for x, y in xy]
+
+
+def bench_jensen_wake(grid_sizes=(100, 200, 400, 1000), turbine_counts=(5, 20),
+                      reference_max_grid=200, seed=0):
+    """
+    Time the broadcast jensen_wake against the loop reference.
+
+    The reference is only run up to reference_max_grid, beyond that it
+    takes minutes per call; the broadcast engine is still timed.
+    """
+    rng = np.random.default_rng(seed)
+    print("Jensen wake field: broadcast vs reference loop")
+    print(f"{'grid':>10} {'turbines':>9} {'reference [s]':>14} {'broadcast [s]':>14} {'speedup':>9}")
+
+    for grid_size in grid_sizes:
+        wind_field = 8.0 + rng.random((grid_size, grid_size))
+        for n_turbines in turbine_counts:
+            turbines = _random_turbines(grid_size, n_turbines, rng)
+            t_fast = _best_time(jensen_wake, wind_field, turbines)
+
+            if grid_size <= reference_max_grid:
+                t_ref = _best_time(jensen_wake_reference, wind_field, turbines, repeat=1)
+                same = np.array_equal(jensen_wake(wind_field, turbines),
+                                      jensen_wake_reference(wind_field, turbines))
+                assert same, "broadcast wake differs from the reference"
+                print(f"{grid_size:>5}x{grid_size:<4} {n_turbines:>9} {t_ref:>14.4f} "
+                      f"{t_fast:>14.4f} {t_ref / t_fast:>8.0f}x")
+            else:
+                print(f"{grid_size:>5}x{grid_size:<4} {n_turbines:>9} {'-':>14} "
+                      f"{t_fast:>14.4f} {'-':>9}")
+
+
+def bench_wake_points(grid_sizes=(200, 1000, 2000), population=200, n_turbines=5, seed=0):
+    """Time point-sampled population wakes against full-grid wakes read at the turbines."""
+    rng = np.random.default_rng(seed)
+    print(f"Turbine-cell wakes for {population} layouts of {n_turbines} turbines")
+    print(f"{'grid':>10} {'grid wake [s]':>14} {'points [s]':>11} {'speedup':>9}")
+
+    for grid_size in grid_sizes:
+        wind_field = 8.0 + rng.random((grid_size, grid_size))
+        layouts = rng.integers(0, grid_size, size=(population, n_turbines, 2))
+
+        start = time.perf_counter()
+        sampled = np.array([jensen_wake(wind_field, layout)[layout[:, 1], layout[:, 0]]
+                            for layout in layouts])
+        t_grid = time.perf_counter() - start
+
+        t_points = _best_time(jensen_wake_points, wind_field, layouts)
+        assert np.array_equal(sampled, jensen_wake_points(wind_field, layouts))
+        print(f"{grid_size:>5}x{grid_size:<4} {t_grid:>14.4f} {t_points:>11.5f} {t_grid / t_points:>8.0f}x")
+
+
+def bench_terrain(grid_sizes=(200, 500, 1000)):
+    """Time the NumPy Perlin terrain against the per-cell pnoise2 reference."""
+    print("Perlin terrain: numpy vs pnoise2")
+    print(f"{'grid':>10} {'pnoise2 [s]':>12} {'numpy [s]':>10} {'speedup':>9}")
+
+    for grid_size in grid_sizes:
+        t_ref = _best_time(generate_terrain, grid_size, "pnoise2", repeat=1)
+        t_fast = _best_time(generate_terrain, grid_size, "numpy")
+        print(f"{grid_size:>5}x{grid_size:<4} {t_ref:>12.3f} {t_fast:>10.3f} {t_ref / t_fast:>8.1f}x")
+
+
+# Child process for bench_startup: opens the fields the way a worker does,
+# reads the turbine cells of one layout, then reports time and peak RSS.
+_STARTUP_SCRIPT = """
+import sys, time
+start = time.perf_counter()
+import numpy as np
+import terrain_data
+
+terrain_data.DATA_DIR, mode = sys.argv[1], sys.argv[2]
+if mode == "eager":
+    terrain = np.load(terrain_data.DATA_DIR + "/terrain.npy")
+    wind_field = np.load(terrain_data.DATA_DIR + "/wind_field.npy")
+else:
+    terrain = terrain_data.terrain()
+    wind_field = terrain_data.wind_field()
+
+cells = np.random.default_rng(0).integers(0, wind_field.shape[0], size=(2, 5))
+float(wind_field[cells[1], cells[0]].sum())
+elapsed = time.perf_counter() - start
+with open("/proc/self/status") as status:
+    peak_kb = next(line.split()[1] for line in status if line.startswith("VmHWM"))
+print(elapsed, peak_kb)
+"""
+
+def bench_startup(grid_size=4000):
+    """
+    Startup time and peak RSS of a process that needs terrain and wind
+    field: eager np.load (the old import-time behaviour) vs terrain_data's
+    lazy memory maps. Uses synthetic grid_size x grid_size fields; peak
+    RSS is read from /proc, so this benchmark is Linux-only.
+    """
+    src_dir = os.path.dirname(os.path.abspath(__file__))
+    print(f"Process startup with {grid_size}x{grid_size} float64 fields")
+    print(f"{'mode':>6} {'time [s]':>9} {'peak RSS [MB]':>14}")
+
+    with tempfile.TemporaryDirectory() as data_dir:
+        field = np.random.default_rng(0).random((grid_size, grid_size))
+        np.save(os.path.join(data_dir, "terrain.npy"), field)
+        np.save(os.path.join(data_dir, "wind_field.npy"), 8.0 + field)
+        del field
+
+        for mode in ("eager", "mmap"):
+            out = subprocess.run([sys.executable, "-c", _STARTUP_SCRIPT, data_dir, mode],
+                                 cwd=src_dir, capture_output=True, text=True, check=True)
+            elapsed, peak_kb = out.stdout.split()
+            print(f"{mode:>6} {float(elapsed):>9.3f} {int(peak_kb) / 1024:>14.1f}")
+
+
+def bench_precision(grid_size=2000, n_layouts=500, seed=0):
+    """
+    Float32 vs float64 fields: memory, wake-field time and the error of
+    the GA's annual energy metric (sum of U^3 over turbines, times hours
+    per year) on random layouts.
+    """
+    rng = np.random.default_rng(seed)
+    layouts = rng.integers(0, grid_size, size=(n_layouts, optimizer.N_TURBINES * 2))
+    turbines = layouts.reshape(n_layouts, -1, 2)[0]
+    results = {}
+
+    print(f"Field precision on {grid_size}x{grid_size}, {n_layouts} layouts")
+    print(f"{'dtype':>8} {'MB/field':>9} {'wake [s]':>9}")
+    for dtype in (np.float64, np.float32):
+        wind_field = compute_wind_field(generate_terrain(grid_size, dtype=dtype))
+        terrain_data.set_field("wind_field", wind_field)
+        results[dtype] = optimizer.compute_energy_batch(layouts).astype(np.float64) * HOURS_PER_YEAR
+
+        t_wake = _best_time(jensen_wake, wind_field, turbines)
+        print(f"{np.dtype(dtype).name:>8} {wind_field.nbytes / 2**20:>9.1f} {t_wake:>9.4f}")
+
+    rel = np.abs(results[np.float32] - results[np.float64]) / results[np.float64]
+    print(f"Annual energy relative error (float32 vs float64): "
+          f"mean {rel.mean():.2e}, max {rel.max():.2e}")
+
+
+if __name__ == "__main__":
+    bench_jensen_wake()
+    bench_wake_points()
+    bench_terrain()
+    bench_startup()
+    bench_precision()
@@ -0,0 +1,140 @@
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+import matplotlib.pyplot as plt
+
+import optimizer
+import terrain_data
+
+# Island model parameters
+N_ISLANDS = 4
+N_EPOCHS = 4                 # migration rounds
+MIGRATION_INTERVAL = 10      # generations per island between migrations
+N_MIGRANTS = 2               # elites sent to the next island each round
+SEED = 42
+
+# Shared-memory blocks attached in each worker, kept alive for its lifetime
+_worker_blocks = []
+
+# --- SHARED MEMORY --------------------------------------------------------
+
+def share_array(array):
+    """Copy array into a new shared-memory block; returns (block, spec)."""
+    block = shared_memory.SharedMemory(create=True, size=array.nbytes)
+    view = np.ndarray(array.shape, dtype=array.dtype, buffer=block.buf)
+    view[:] = array
+    return block, (block.name, array.shape, array.dtype.str)
+
+def attach_array(spec):
+    name, shape, dtype = spec
+    block = shared_memory.SharedMemory(name=name)
+    _worker_blocks.append(block)
+    return np.ndarray(shape, dtype=np.dtype(dtype), buffer=block.buf)
+
+def _init_worker(terrain_spec, wind_field_spec):
+    # Serve the parent's arrays instead of opening private copies
+    terrain_data.set_field("terrain", attach_array(terrain_spec))
+    terrain_data.set_field("wind_field", attach_array(wind_field_spec))
+
+# --- ISLAND EVOLUTION -----------------------------------------------------
+
+def evolve_island(population, num_generations, seed):
+    """
+    Run one island for num_generations starting from population.
+    Returns the final population, its fitness and the best fitness per
+    generation (including the starting population).
+    """
+    ga = optimizer.build_ga(num_generations=num_generations,
+                            initial_population=population,
+                            random_seed=seed)
+    ga.run()
+    return ga.population, ga.last_generation_fitness, np.asarray(ga.best_solutions_fitness)
+
+def migrate(populations, fitnesses, n_migrants=N_MIGRANTS):
+    """
+    Ring migration: the n_migrants best solutions of island i replace the
+    n_migrants worst solutions of island i + 1.
+    """
+    n_islands = len(populations)
+    best = [np.argsort(fit)[-n_migrants:] for fit in fitnesses]
+    elites = [(pop[idx].copy(), fit[idx].copy())
+              for pop, fit, idx in zip(populations, fitnesses, best)]
+
+    for i in range(n_islands):
+        target = (i + 1) % n_islands
+        worst = np.argsort(fitnesses[target])[:n_migrants]
+        populations[target][worst], fitnesses[target][worst] = elites[i]
+
+    return populations, fitnesses
+
+def run_islands(n_islands=N_ISLANDS, n_epochs=N_EPOCHS,
+                migration_interval=MIGRATION_INTERVAL, seed=SEED, max_workers=None):
+    """
+    Island-model GA across processes.
+
+    Each island is an independent pygad population evolved in a worker of
+    a ProcessPoolExecutor; after every migration_interval generations the
+    elites migrate around a ring. terrain and wind_field are placed in
+    shared memory once and attached by the workers.
+
+    Returns the best layout across islands, its fitness and the per-island
+    convergence curves, shape (n_islands, n_epochs * migration_interval + 1).
+    """
+    seeds = np.random.SeedSequence(seed)
+    rng = np.random.default_rng(seeds.spawn(1)[0])
+    populations = [rng.integers(0, terrain_data.grid_size(),
+                                size=(optimizer.SOL_PER_POP, optimizer.N_TURBINES * 2)).astype(float)
+                   for _ in range(n_islands)]
+    curves = [[] for _ in range(n_islands)]
+
+    terrain_block, terrain_spec = share_array(terrain_data.terrain())
+    wind_block, wind_spec = share_array(terrain_data.wind_field())
+
+    try:
+        with ProcessPoolExecutor(max_workers=max_workers or n_islands,
+                                 initializer=_init_worker,
+                                 initargs=(terrain_spec, wind_spec)) as pool:
+            for epoch in range(n_epochs):
+                epoch_seeds = [int(s.generate_state(1)[0]) for s in seeds.spawn(n_islands)]
+                futures = [pool.submit(evolve_island, populations[i], migration_interval, epoch_seeds[i])
+                           for i in range(n_islands)]
+                results = [f.result() for f in futures]
+
+                populations = [pop for pop, _, _ in results]
+                fitnesses = [fit for _, fit, _ in results]
+                for i, (_, _, best) in enumerate(results):
+                    # Each epoch's curve starts with the previous epoch's end state
+                    curves[i].extend(best if epoch == 0 else best[1:])
+
+                if epoch < n_epochs - 1:
+                    populations, fitnesses = migrate(populations, fitnesses)
+    finally:
+        for block in (terrain_block, wind_block):
+            block.close()
+            block.unlink()
+
+    best_island = int(np.argmax([fit.max() for fit in fitnesses]))
+    best_idx = int(np.argmax(fitnesses[best_island]))
+    return (populations[best_island][best_idx],
+            fitnesses[best_island][best_idx],
+            np.array(curves))
+
+if __name__ == "__main__":
+    solution, fitness, curves = run_islands()
+    print(f"Best fitness across {N_ISLANDS} islands: {fitness:.2f}")
+
+    np.save("../data/island_optimal_layout.npy", solution)
+
+    plt.figure(figsize=(8, 5))
+    for i, curve in enumerate(curves):
+        plt.plot(curve, label=f"Island {i + 1}")
+    for epoch in range(1, N_EPOCHS):
+        plt.axvline(epoch * MIGRATION_INTERVAL, color="gray", linestyle=":", alpha=0.5)
+    plt.xlabel("Generation")
+    plt.ylabel("Best fitness")
+    plt.title("Island-Model GA Convergence")
+    plt.legend()
+    plt.grid(alpha=0.3)
+    plt.savefig("../results/island_fitness_curves.png", dpi=300)
+    plt.close()
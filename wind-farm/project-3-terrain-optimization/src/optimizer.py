@@ -1,21 +1,38 @@
+from collections import OrderedDict
+
 import numpy as np
 import matplotlib.pyplot as plt
 import pygad
 
-# Load data
-terrain = np.load("../data/terrain.npy")
-wind_field = np.load("../data/wind_field.npy")
-
-# Import wake model
-from wake_model import jensen_wake
+import terrain_data
+from wake_model import jensen_wake, jensen_wake_points
 
-GRID_SIZE = terrain.shape[0]
 N_TURBINES = 5
 MIN_SPACING = 20  # minimum distance between turbines (grid units)
 
+# GA size
+SOL_PER_POP = 20
+NUM_GENERATIONS = 40
+# Solutions scored per fitness call (None or 1 scores one at a time)
+FITNESS_BATCH_SIZE = SOL_PER_POP
+# "points" evaluates only the turbine-to-turbine wakes, "grid" builds the
+# full jensen_wake field and reads it at the turbine cells.
+WAKE_MODE = "points"
+# Layouts kept in the LRU fitness cache (0 disables caching). Off by
+# default: pygad already carries elite fitness forward, and with 10 genes
+# over a 200-cell gene space children rarely repeat a layout, so the
+# default GA (780 fitness lookups per run) got 0-1.5% hits over several
+# seeds. It pays off when layouts recur: small grids, low mutation
+# rates, or long runs whose population has converged.
+FITNESS_CACHE_SIZE = 0
+
 # --- ENERGY MODEL ---------------------------------------------------------
 
 def compute_energy(layout):
+    if WAKE_MODE == "points":
+        return compute_energy_batch(layout)[0]
+
+    wind_field = terrain_data.wind_field()
     turbines = [(int(layout[i]), int(layout[i+1])) for i in range(0, len(layout), 2)]
     wake = jensen_wake(wind_field, turbines)
     effective_wind = wind_field - wake
@@ -28,6 +45,25 @@ def compute_energy(layout):
 
     return power
 
+def layouts_to_turbines(layouts):
+    """Reshape flat GA solutions to an integer (n_layouts, N_TURBINES, 2) array."""
+    return np.asarray(layouts).astype(int).reshape(-1, N_TURBINES, 2)
+
+def compute_energy_batch(layouts):
+    wind_field = terrain_data.wind_field()
+    turbines = layouts_to_turbines(layouts)
+    x, y = turbines[:, :, 0], turbines[:, :, 1]
+
+    if WAKE_MODE == "points":
+        deficit = jensen_wake_points(wind_field, turbines)
+    else:
+        # Only the turbine cells are read, so sample before subtracting
+        deficit = np.array([jensen_wake(wind_field, layout)[layout[:, 1], layout[:, 0]]
+                            for layout in turbines])
+
+    effective_wind = np.clip(wind_field[y, x] - deficit, 0, None)
+    return np.sum(effective_wind ** 3, axis=1)
+
 # --- CONSTRAINTS ----------------------------------------------------------
 
 def spacing_penalty(layout):
@@ -44,71 +80,173 @@ def spacing_penalty(layout):
 
     return penalty
 
+def spacing_penalty_batch(layouts):
+    turbines = layouts_to_turbines(layouts)
+    diff = turbines[:, :, None, :] - turbines[:, None, :, :]
+    dist = np.sqrt(np.sum(diff ** 2, axis=-1))
+
+    i, j = np.triu_indices(N_TURBINES, k=1)
+    shortfall = MIN_SPACING - dist[:, i, j]
+    return np.sum(np.where(shortfall > 0, shortfall * 1000, 0), axis=1)
+
+# --- FITNESS CACHE --------------------------------------------------------
+
+class FitnessCache:
+    """
+    Bounded LRU cache of layout fitness values.
+
+    Layouts are keyed on their sorted (x, y) turbine cells, so the same
+    turbine set in a different gene order is a cache hit.
+    """
+
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._store = OrderedDict()
+
+    @staticmethod
+    def key(layout):
+        turbines = layouts_to_turbines(layout)[0]
+        return tuple(sorted(map(tuple, turbines.tolist())))
+
+    def get(self, key):
+        if key in self._store:
+            self._store.move_to_end(key)
+            self.hits += 1
+            return self._store[key]
+        self.misses += 1
+        return None
+
+    def put(self, key, fitness):
+        if self.maxsize <= 0:
+            return
+        self._store[key] = fitness
+        self._store.move_to_end(key)
+        if len(self._store) > self.maxsize:
+            self._store.popitem(last=False)
+
+    def report(self):
+        lookups = self.hits + self.misses
+        rate = self.hits / lookups if lookups else 0.0
+        return (f"Fitness cache: {self.hits} hits, {self.misses} misses "
+                f"({rate:.1%} hit rate, {len(self._store)}/{self.maxsize} layouts stored)")
+
+fitness_cache = FitnessCache(FITNESS_CACHE_SIZE)
+
 # --- FITNESS FUNCTION -----------------------------------------------------
 
 def fitness_func(ga_instance, solution, solution_idx):
-    energy = compute_energy(solution)
-    penalty = spacing_penalty(solution)
-    return energy - penalty
+    if fitness_cache.maxsize <= 0:
+        return compute_energy(solution) - spacing_penalty(solution)
+    key = FitnessCache.key(solution)
+    fitness = fitness_cache.get(key)
+    if fitness is None:
+        energy = compute_energy(solution)
+        penalty = spacing_penalty(solution)
+        fitness = energy - penalty
+        fitness_cache.put(key, fitness)
+    return fitness
+
+def fitness_func_batch(ga_instance, solutions, solution_indices):
+    if fitness_cache.maxsize <= 0:
+        return compute_energy_batch(solutions) - spacing_penalty_batch(solutions)
+    keys = [FitnessCache.key(solution) for solution in solutions]
+    fitness = np.empty(len(keys))
+
+    # Unseen layouts are scored once even if repeated within the batch
+    missing = {}
+    for i, key in enumerate(keys):
+        if key in missing:
+            fitness_cache.hits += 1
+            missing[key].append(i)
+            continue
+        cached = fitness_cache.get(key)
+        if cached is None:
+            missing[key] = [i]
+        else:
+            fitness[i] = cached
+
+    if missing:
+        first = [rows[0] for rows in missing.values()]
+        unseen = np.asarray(solutions)[first]
+        scores = compute_energy_batch(unseen) - spacing_penalty_batch(unseen)
+        for (key, rows), score in zip(missing.items(), scores):
+            fitness[rows] = score
+            fitness_cache.put(key, score)
+
+    return fitness
 
 # --- GA SETUP -------------------------------------------------------------
 
-gene_space = list(range(GRID_SIZE))
-
-ga = pygad.GA(
-    num_generations=40,
-    num_parents_mating=8,
-    fitness_func=fitness_func,
-    sol_per_pop=20,
-    num_genes=N_TURBINES * 2,
-    gene_space=gene_space,
-    mutation_percent_genes=20,
-    mutation_type="random",
-    crossover_type="single_point",
-    keep_parents=2
-)
-
-# --- RUN GA ---------------------------------------------------------------
-
-ga.run()
-
-solution, fitness, _ = ga.best_solution()
-
-# Save optimal layout
-np.save("../data/optimal_layout.npy", solution)
-
-# Convert layout to coordinate pairs
-turbines_initial = [(int(ga.initial_population[0][i]),
-                     int(ga.initial_population[0][i+1]))
-                    for i in range(0, N_TURBINES*2, 2)]
-
-turbines_optimal = [(int(solution[i]), int(solution[i+1]))
-                    for i in range(0, N_TURBINES*2, 2)]
-
-# --- PLOTS ----------------------------------------------------------------
-
-# Initial layout
-plt.figure(figsize=(6, 6))
-plt.imshow(terrain, cmap="terrain")
-for (x, y) in turbines_initial:
-    plt.scatter(x, y, c="red", s=50)
-plt.title("Initial Turbine Layout")
-plt.savefig("../results/initial_layout.png", dpi=300)
-plt.close()
-
-# Optimized layout
-plt.figure(figsize=(6, 6))
-plt.imshow(terrain, cmap="terrain")
-for (x, y) in turbines_optimal:
-    plt.scatter(x, y, c="blue", s=50)
-plt.title("Optimized Turbine Layout")
-plt.savefig("../results/optimized_layout.png", dpi=300)
-plt.close()
-
-# Fitness curve 
-plt.figure()
-fig = ga.plot_fitness(title="GA Fitness Curve")
-fig.savefig("../results/fitness_curve.png", dpi=300)
-plt.close(fig)
-
-
+def build_ga(num_generations=NUM_GENERATIONS, initial_population=None, random_seed=None):
+    """
+    Build the layout GA. An initial_population of shape
+    (n_solutions, N_TURBINES * 2) replaces the random SOL_PER_POP start.
+    """
+    gene_space = list(range(terrain_data.grid_size()))
+    batch_mode = FITNESS_BATCH_SIZE not in (None, 1)
+
+    return pygad.GA(
+        num_generations=num_generations,
+        num_parents_mating=8,
+        fitness_func=fitness_func_batch if batch_mode else fitness_func,
+        fitness_batch_size=FITNESS_BATCH_SIZE,
+        sol_per_pop=SOL_PER_POP,
+        num_genes=N_TURBINES * 2,
+        initial_population=initial_population,
+        gene_space=gene_space,
+        mutation_percent_genes=20,
+        mutation_type="random",
+        crossover_type="single_point",
+        keep_parents=2,
+        random_seed=random_seed
+    )
+
+if __name__ == "__main__":
+    ga = build_ga()
+
+    # --- RUN GA -----------------------------------------------------------
+
+    ga.run()
+    if fitness_cache.maxsize > 0:
+        print(fitness_cache.report())
+
+    solution, fitness, _ = ga.best_solution()
+
+    # Save optimal layout
+    np.save("../data/optimal_layout.npy", solution)
+
+    # Convert layout to coordinate pairs
+    turbines_initial = [(int(ga.initial_population[0][i]),
+                         int(ga.initial_population[0][i+1]))
+                        for i in range(0, N_TURBINES*2, 2)]
+
+    turbines_optimal = [(int(solution[i]), int(solution[i+1]))
+                        for i in range(0, N_TURBINES*2, 2)]
+
+    # --- PLOTS ------------------------------------------------------------
+
+    # Initial layout
+    plt.figure(figsize=(6, 6))
+    plt.imshow(terrain_data.terrain(), cmap="terrain")
+    for (x, y) in turbines_initial:
+        plt.scatter(x, y, c="red", s=50)
+    plt.title("Initial Turbine Layout")
+    plt.savefig("../results/initial_layout.png", dpi=300)
+    plt.close()
+
+    # Optimized layout
+    plt.figure(figsize=(6, 6))
+    plt.imshow(terrain_data.terrain(), cmap="terrain")
+    for (x, y) in turbines_optimal:
+        plt.scatter(x, y, c="blue", s=50)
+    plt.title("Optimized Turbine Layout")
+    plt.savefig("../results/optimized_layout.png", dpi=300)
+    plt.close()
+
+    # Fitness curve
+    plt.figure()
+    fig = ga.plot_fitness(title="GA Fitness Curve")
+    fig.savefig("../results/fitness_curve.png", dpi=300)
+    plt.close(fig)
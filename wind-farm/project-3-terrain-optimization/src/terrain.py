@@ -1,9 +1,10 @@
 import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib import cm
-from noise import pnoise2
 import os
 
+import terrain_data
+
 # Paths relative to running inside src/
 DATA_PATH = "../data/terrain.npy"
 MAP_PATH = "../results/terrain_map.png"
@@ -14,26 +15,186 @@ SCALE = 100.0
 OCTAVES = 6
 PERSISTENCE = 0.5
 LACUNARITY = 2.0
+REPEAT = 1024
+BASE = 42
+
+# Rows of noise evaluated per block (bounds working memory)
+CHUNK_ROWS = 128
+
+# --- PERLIN NOISE ---------------------------------------------------------
+# NumPy port of the "improved" Perlin noise2 in the noise package
+# (noise/_perlin.c). It runs in float32 like the C code, so values match
+# pnoise2. The permutation table is tiled to 768 entries: the C table has
+# 512, and for lattice indices past 255 - base the C lookups run off its
+# end, so pnoise2 returns undefined values there.
+
+_PERM = np.array([
+    151, 160, 137, 91, 90, 15, 131, 13, 201, 95, 96, 53, 194, 233, 7, 225, 140,
+    36, 103, 30, 69, 142, 8, 99, 37, 240, 21, 10, 23, 190, 6, 148, 247, 120,
+    234, 75, 0, 26, 197, 62, 94, 252, 219, 203, 117, 35, 11, 32, 57, 177, 33,
+    88, 237, 149, 56, 87, 174, 20, 125, 136, 171, 168, 68, 175, 74, 165, 71,
+    134, 139, 48, 27, 166, 77, 146, 158, 231, 83, 111, 229, 122, 60, 211, 133,
+    230, 220, 105, 92, 41, 55, 46, 245, 40, 244, 102, 143, 54, 65, 25, 63, 161,
+    1, 216, 80, 73, 209, 76, 132, 187, 208, 89, 18, 169, 200, 196, 135, 130,
+    116, 188, 159, 86, 164, 100, 109, 198, 173, 186, 3, 64, 52, 217, 226, 250,
+    124, 123, 5, 202, 38, 147, 118, 126, 255, 82, 85, 212, 207, 206, 59, 227,
+    47, 16, 58, 17, 182, 189, 28, 42, 223, 183, 170, 213, 119, 248, 152, 2, 44,
+    154, 163, 70, 221, 153, 101, 155, 167, 43, 172, 9, 129, 22, 39, 253, 19, 98,
+    108, 110, 79, 113, 224, 232, 178, 185, 112, 104, 218, 246, 97, 228, 251, 34,
+    242, 193, 238, 210, 144, 12, 191, 179, 162, 241, 81, 51, 145, 235, 249, 14,
+    239, 107, 49, 192, 214, 31, 181, 199, 106, 157, 184, 84, 204, 176, 115, 121,
+    50, 45, 127, 4, 150, 254, 138, 236, 205, 93, 222, 114, 67, 29, 24, 72, 243,
+    141, 128, 195, 78, 66, 215, 61, 156, 180], dtype=np.intp)
+_PERM = np.tile(_PERM, 3)
+
+# x and y components of the 16 gradient directions
+_GRAD_X = np.array([1, -1, 1, -1, 1, -1, 1, -1, 0, 0, 0, 0, 1, -1, 0, 0], dtype=np.float32)
+_GRAD_Y = np.array([1, 1, -1, -1, 0, 0, 0, 0, 1, -1, 1, -1, 0, 0, -1, 1], dtype=np.float32)
+
+def _fade(t):
+    return t * t * t * (t * (t * np.float32(6) - np.float32(15)) + np.float32(10))
+
+def _lerp(t, a, b):
+    return a + t * (b - a)
+
+def _grad(h, x, y):
+    h = h & 15
+    return x * _GRAD_X[h] + y * _GRAD_Y[h]
+
+def _lattice(coord, repeat, base):
+    """Lattice indices, next indices and fractional offsets along one axis."""
+    cell = np.floor(np.fmod(coord, repeat)).astype(np.intp)
+    nxt = np.fmod((cell + 1).astype(np.float32), repeat).astype(np.intp)
+    frac = coord - np.floor(coord)
+    return (cell & 255) + base, (nxt & 255) + base, frac
+
+def _noise2(x, y, repeatx, repeaty, base):
+    """Single-octave noise on the grid spanned by 1-D coordinates x (rows) and y (cols)."""
+    i, ii, x = _lattice(x, repeatx, base)
+    j, jj, y = _lattice(y, repeaty, base)
+    fx = _fade(x)[:, None]
+    fy = _fade(y)[None, :]
+    x = x[:, None]
+    y = y[None, :]
+    one = np.float32(1)
+
+    A = _PERM[i][:, None]
+    B = _PERM[ii][:, None]
+    AA = _PERM[A + j]
+    AB = _PERM[A + jj]
+    BA = _PERM[B + j]
+    BB = _PERM[B + jj]
+
+    return _lerp(fy, _lerp(fx, _grad(_PERM[AA], x, y),
+                           _grad(_PERM[BA], x - one, y)),
+                 _lerp(fx, _grad(_PERM[AB], x, y - one),
+                       _grad(_PERM[BB], x - one, y - one)))
+
+def perlin_grid(x, y, octaves=OCTAVES, persistence=PERSISTENCE, lacunarity=LACUNARITY,
+                repeatx=REPEAT, repeaty=REPEAT, base=BASE):
+    """
+    Fractal Perlin noise on the grid x (rows) by y (columns).
+
+    Vectorized equivalent of pnoise2(x[i], y[j], ...) for every grid cell,
+    returned as a float64 array of shape (len(x), len(y)).
+    """
+    x = np.asarray(x, dtype=np.float32)
+    y = np.asarray(y, dtype=np.float32)
+    persistence = np.float32(persistence)
+    lacunarity = np.float32(lacunarity)
+    repeatx = np.float32(repeatx)
+    repeaty = np.float32(repeaty)
+
+    freq = np.float32(1)
+    amp = np.float32(1)
+    total = np.zeros((x.size, y.size), dtype=np.float32)
+    max_amp = np.float32(0)
 
-def generate_terrain(grid_size=GRID_SIZE):
-    terrain = np.zeros((grid_size, grid_size))
-    
-    for i in range(grid_size):
+    for _ in range(octaves):
+        total += _noise2(x * freq, y * freq, repeatx * freq, repeaty * freq, base) * amp
+        max_amp += amp
+        freq *= lacunarity
+        amp *= persistence
+
+    if octaves == 1:
+        return total.astype(np.float64)
+    return (total / max_amp).astype(np.float64)
+
+# --- TERRAIN --------------------------------------------------------------
+
+def _raw_terrain_pnoise2(rows, grid_size):
+    from noise import pnoise2
+
+    terrain = np.zeros((len(rows), grid_size))
+    for r, i in enumerate(rows):
         for j in range(grid_size):
-            terrain[i][j] = pnoise2(i / SCALE,
+            terrain[r][j] = pnoise2(i / SCALE,
                                     j / SCALE,
                                     octaves=OCTAVES,
                                     persistence=PERSISTENCE,
                                     lacunarity=LACUNARITY,
-                                    repeatx=1024,
-                                    repeaty=1024,
-                                    base=42)
-    
-    terrain = (terrain - terrain.min()) / (terrain.max() - terrain.min())
+                                    repeatx=REPEAT,
+                                    repeaty=REPEAT,
+                                    base=BASE)
     return terrain
 
+def _raw_terrain(rows, grid_size, backend):
+    if backend == "numpy":
+        return perlin_grid(np.asarray(rows) / SCALE, np.arange(grid_size) / SCALE)
+    if backend == "pnoise2":
+        return _raw_terrain_pnoise2(rows, grid_size)
+    raise ValueError(f"Unknown terrain backend: {backend!r}")
+
+def _fill_terrain(terrain, chunk_rows, backend):
+    """Write raw noise into terrain chunk_rows rows at a time; returns (min, max)."""
+    grid_size = terrain.shape[0]
+    lo, hi = np.inf, -np.inf
+
+    for start in range(0, grid_size, chunk_rows):
+        stop = min(start + chunk_rows, grid_size)
+        chunk = _raw_terrain(range(start, stop), grid_size, backend)
+        terrain[start:stop] = chunk
+        lo, hi = min(lo, chunk.min()), max(hi, chunk.max())
+
+    # Noise is float32 internally, so the bounds are exact in either dtype
+    return terrain.dtype.type(lo), terrain.dtype.type(hi)
+
+def generate_terrain(grid_size=GRID_SIZE, backend="numpy", dtype=np.float64):
+    """
+    Perlin terrain normalized to [0, 1], as an array of dtype.
+
+    backend="numpy" evaluates whole blocks of rows at once; "pnoise2" calls
+    the noise package once per cell and is kept as the reference.
+    """
+    terrain = np.empty((grid_size, grid_size), dtype=dtype)
+    lo, hi = _fill_terrain(terrain, CHUNK_ROWS, backend)
+    terrain = (terrain - lo) / (hi - lo)
+    return terrain
+
+def generate_terrain_tiled(path, grid_size=GRID_SIZE, chunk_rows=CHUNK_ROWS, backend="numpy",
+                           dtype=np.float64):
+    """
+    Generate terrain straight into a memory-mapped .npy file at path.
+
+    Rows are produced chunk_rows at a time, so peak memory is one chunk
+    rather than the full grid. A second pass over the file applies the
+    same [0, 1] normalization as generate_terrain. Returns the read-only
+    memory map.
+    """
+    terrain = np.lib.format.open_memmap(path, mode="w+", dtype=dtype,
+                                        shape=(grid_size, grid_size))
+    lo, hi = _fill_terrain(terrain, chunk_rows, backend)
+
+    for start in range(0, grid_size, chunk_rows):
+        stop = min(start + chunk_rows, grid_size)
+        terrain[start:stop] = (terrain[start:stop] - lo) / (hi - lo)
+
+    terrain.flush()
+    del terrain
+    return np.load(path, mmap_mode="r")
+
 if __name__ == "__main__":
-    terrain = generate_terrain()
+    terrain = generate_terrain(dtype=terrain_data.FIELD_DTYPE)
 
     # Save terrain
     np.save(DATA_PATH, terrain)
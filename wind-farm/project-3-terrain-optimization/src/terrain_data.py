@@ -0,0 +1,38 @@
+import os
+import numpy as np
+
+# Data directory, resolved from this file so worker processes find it too
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "data")
+
+# Precision of the terrain, wind and wake fields. The generating scripts
+# write this dtype and the wake model computes in the dtype it is given;
+# np.float32 halves memory and bandwidth (benchmarks.bench_precision).
+FIELD_DTYPE = np.float64
+
+# Arrays opened so far in this process, by field name
+_fields = {}
+
+def load_field(name):
+    """
+    Return the array stored in DATA_DIR/<name>.npy.
+
+    The file is opened read-only with mmap_mode="r" on first use and cached,
+    so nothing is read at import time and processes opening the same file
+    share its pages through the OS page cache.
+    """
+    if name not in _fields:
+        _fields[name] = np.load(os.path.join(DATA_DIR, f"{name}.npy"), mmap_mode="r")
+    return _fields[name]
+
+def set_field(name, array):
+    """Serve array for name instead of the file, e.g. a shared-memory view."""
+    _fields[name] = array
+
+def terrain():
+    return load_field("terrain")
+
+def wind_field():
+    return load_field("wind_field")
+
+def grid_size():
+    return terrain().shape[0]
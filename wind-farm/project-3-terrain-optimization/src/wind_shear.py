@@ -1,8 +1,7 @@
 import numpy as np
 import matplotlib.pyplot as plt
 
-# Load terrain
-terrain = np.load("../data/terrain.npy")
+import terrain_data
 
 # Parameters
 U_ref = 8.0          # reference wind speed at z_ref
@@ -10,15 +9,16 @@ z_ref = 10.0         # reference height (m)
 alpha = 0.15         # wind shear exponent (typical for open terrain)
 hub_height = 80.0    # turbine hub height (m)
 
-# Elevation-adjusted wind speed
-def compute_wind_field(terrain):
+# Elevation-adjusted wind speed, in the dtype of terrain unless given
+def compute_wind_field(terrain, dtype=None):
+    terrain = np.asarray(terrain, dtype=dtype)
     elevation = terrain * 200  # scale terrain to 0–200 m elevation
     effective_height = hub_height + elevation
     wind_field = U_ref * (effective_height / z_ref) ** alpha
     return wind_field
 
 if __name__ == "__main__":
-    wind_field = compute_wind_field(terrain)
+    wind_field = compute_wind_field(terrain_data.terrain(), dtype=terrain_data.FIELD_DTYPE)
 
     # Save wind field
     np.save("../data/wind_field.npy", wind_field)